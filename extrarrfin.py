@@ -103,6 +103,10 @@ def cli(
     ctx_data = setup_context(cfg, sonarr_client)
     ctx_data["radarr"] = radarr_client
     ctx.obj.update(ctx_data)
+    ctx.call_on_close(ctx_data["downloader"].close)
+    ctx.call_on_close(sonarr_client.close)
+    if radarr_client:
+        ctx.call_on_close(radarr_client.close)
 
 
 @cli.command()
@@ -327,8 +331,9 @@ def download(
             if jf_url and jf_api_key:
                 try:
                     console.print("\n[blue]Refreshing Jellyfin library...[/blue]")
-                    jellyfin = JellyfinClient(jf_url, jf_api_key)
-                    if jellyfin.refresh_library():
+                    with JellyfinClient(jf_url, jf_api_key) as jellyfin:
+                        refreshed = jellyfin.refresh_library()
+                    if refreshed:
                         console.print(
                             "[green]✓ Jellyfin library refresh triggered[/green]"
                         )
@@ -511,6 +516,9 @@ def schedule_mode(
             )
             console.print(f"[bold blue]{'=' * 60}[/bold blue]\n")
 
+            # Start from fresh directory listings and video info
+            ctx.obj["downloader"].clear_cache()
+
             # Call the download command logic
             ctx.invoke(
                 download,
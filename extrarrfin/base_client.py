@@ -2,14 +2,35 @@
 Base API Client for *arr applications (Sonarr, Radarr, etc.)
 """
 
+import json
 import logging
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Generic, TypeVar
+from collections.abc import Callable
+from typing import Any, ClassVar, Generic, TypeVar
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:  # Optional: orjson parses the large series/movie lists 2-3x faster
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
 
 logger = logging.getLogger(__name__)
 
+# JSON decoder for API responses, bound once; both accept the raw bytes, so
+# the body is never decoded to an intermediate str
+_loads: Callable[[bytes], Any] = orjson.loads if orjson else json.loads
+
+# How long a library read (series/movie listing, episodes of a series) is
+# reused before it is fetched again
+RESPONSE_CACHE_TTL = 30.0
+# How long tag labels are trusted; long-running schedule mode picks up new
+# or renamed tags after this
+TAGS_CACHE_TTL = 60.0
+
 # Generic type for media items (Series, Movie, etc.)
 T = TypeVar("T")
 
@@ -17,6 +38,10 @@ T = TypeVar("T")
 class BaseArrClient(ABC, Generic[T]):
     """Base client for *arr applications API"""
 
+    # Tag maps shared by every client of the same server:
+    # url -> (fetched at, tag_id -> label)
+    _tags_by_url: ClassVar[dict[str, tuple[float, dict[int, str]]]] = {}
+
     def __init__(self, url: str, api_key: str):
         self.url = url.rstrip("/")
         self.api_key = api_key
@@ -24,47 +49,109 @@ class BaseArrClient(ABC, Generic[T]):
         self.session.headers.update(
             {"X-Api-Key": api_key, "Content-Type": "application/json"}
         )
-        # Cache for tags
-        self._tags_cache: dict[int, str] | None = None
+        # Pooled keep-alive connections shared by concurrent callers;
+        # idempotent requests are retried on gateway errors
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]
+            ),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        # want-extras tag IDs, derived from the tag map they were computed on
+        self._want_extras_tag_ids: tuple[dict[int, str], frozenset[int]] | None = None
+        # Short-lived cache of library reads:
+        # (endpoint, params) -> (fetched at, data)
+        self._response_cache: dict[tuple, tuple[float, Any]] = {}
+
+    def close(self) -> None:
+        """Close the HTTP session"""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def _get(self, endpoint: str, params: dict | None = None) -> Any:
         """Perform a GET request to the API"""
         url = f"{self.url}/api/v3/{endpoint}"
         response = self.session.get(url, params=params)
         response.raise_for_status()
-        return response.json()
+        return _loads(response.content)
 
     def _post(self, endpoint: str, data: dict) -> Any:
         """Perform a POST request to the API"""
         url = f"{self.url}/api/v3/{endpoint}"
-        response = self.session.post(url, json=data)
+        body = orjson.dumps(data) if orjson else json.dumps(data).encode("utf-8")
+        response = self.session.post(url, data=body)
         response.raise_for_status()
-        return response.json()
+        # Commands (e.g. rescans) may change the library
+        self._response_cache.clear()
+        return _loads(response.content)
+
+    def _get_cached(self, endpoint: str, params: dict | None = None) -> Any:
+        """GET a library read, reusing the response for ``RESPONSE_CACHE_TTL``"""
+        key = (endpoint, tuple(sorted(params.items())) if params else ())
+        cached = self._response_cache.get(key)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < RESPONSE_CACHE_TTL:
+            return cached[1]
+        data = self._get(endpoint, params=params)
+        self._response_cache[key] = (now, data)
+        return data
 
     def get_all_tags(self) -> dict[int, str]:
-        """Fetch all tags and return a mapping of tag_id -> tag_label"""
-        if self._tags_cache is not None:
-            return self._tags_cache
+        """Fetch all tags and return a mapping of tag_id -> tag_label
+
+        The mapping is shared with other clients of the same server and
+        refetched after ``TAGS_CACHE_TTL`` seconds.
+        """
+        cached = self._tags_by_url.get(self.url)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < TAGS_CACHE_TTL:
+            return cached[1]
 
         data = self._get("tag")
-        self._tags_cache = {tag["id"]: tag["label"] for tag in data}
-        return self._tags_cache
+        tags = {tag["id"]: tag["label"] for tag in data}
+        self._tags_by_url[self.url] = (now, tags)
+        return tags
+
+    def get_want_extras_tag_ids(self) -> frozenset[int]:
+        """IDs of the 'want-extras' / 'want_extras' tags"""
+        tags = self.get_all_tags()
+        if (
+            self._want_extras_tag_ids is None
+            or self._want_extras_tag_ids[0] is not tags
+        ):
+            tag_ids = frozenset(
+                tag_id
+                for tag_id, label in tags.items()
+                if label.lower() in ("want-extras", "want_extras")
+            )
+            self._want_extras_tag_ids = (tags, tag_ids)
+        return self._want_extras_tag_ids[1]
 
     def has_want_extras_tag(self, media: Any) -> bool:
         """Check if media item has 'want-extras' or 'want_extras' tag"""
-        if not hasattr(media, "tags") or not media.tags:
+        tags = getattr(media, "tags", None)
+        if not tags:
             return False
-
-        # Get all tags to map IDs to labels
-        all_tags = self.get_all_tags()
-
-        # Check if any of the media tags match want-extras or want_extras
-        for tag_id in media.tags:
-            tag_label = all_tags.get(tag_id, "").lower()
-            if tag_label in ["want-extras", "want_extras"]:
-                return True
-
-        return False
+        return not self.get_want_extras_tag_ids().isdisjoint(tags)
+
+    def _monitored_with_want_extras(self, endpoint: str) -> list[dict]:
+        """Raw monitored library items carrying a want-extras tag"""
+        tag_ids = self.get_want_extras_tag_ids()
+        if not tag_ids:
+            return []
+        return [
+            item
+            for item in self._get_cached(endpoint)
+            if item["monitored"] and not tag_ids.isdisjoint(item.get("tags") or ())
+        ]
 
     def test_connection(self) -> bool:
         """Test the connection to the *arr application"""
@@ -72,7 +159,7 @@ class BaseArrClient(ABC, Generic[T]):
             self._get("system/status")
             return True
         except Exception as e:
-            logger.error(f"Connection test failed: {e}")
+            logger.error("Connection test failed: %s", e)
             return False
 
     @abstractmethod
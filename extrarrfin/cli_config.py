@@ -134,5 +134,9 @@ def setup_context(
             use_strm_files=config.use_strm_files,
             min_score=config.min_score,
             youtube_search_results=config.youtube_search_results,
+            cache_directory=config.cache_directory,
+            search_cache_days=config.search_cache_days,
+            parallel_downloads=config.parallel_downloads,
+            parallel_searches=config.parallel_searches,
         ),
     }
@@ -50,6 +50,10 @@ def list_command(
     ) as progress:
         task = progress.add_task("Fetching series...", total=None)
         series_list = sonarr.get_monitored_series()
+        season0_flags: dict[int, bool] = {}
+        if "season0" in active_modes:
+            progress.update(task, description="Checking season 0 episodes...")
+            season0_flags = sonarr.batch_monitored_season_zero(series_list)
         progress.update(task, description="Fetching movies...")
 
         # Fetch movies if Radarr configured and tag mode active
@@ -70,7 +74,7 @@ def list_command(
         include = False
         if "tag" in active_modes and sonarr.has_want_extras_tag(s):
             include = True
-        if "season0" in active_modes and sonarr.has_monitored_season_zero_episodes(s):
+        if season0_flags.get(s.id, False):
             include = True
         if include:
             filtered_items.append({"type": "series", "data": s})
@@ -150,7 +154,7 @@ def list_command(
         if item_type == "series":
             series = cast(Series, media)
             has_tag = sonarr.has_want_extras_tag(series)
-            has_season0 = sonarr.has_monitored_season_zero_episodes(series)
+            has_season0 = season0_flags.get(series.id, False)
 
             # Process Season 0 episodes if applicable
             if has_season0 and "season0" in active_modes:
@@ -162,6 +166,9 @@ def list_command(
                         series, config.media_directory, config.sonarr_directory
                     )
                     counted_srt_files: set[str] = set()
+                    # One listing for the whole series: sizes come from the
+                    # directory entries instead of exists() + stat() per file
+                    entries = downloader.directory_entries(output_dir)
 
                     for ep in monitored_episodes:
                         file_info = downloader.get_episode_file_info(
@@ -170,14 +177,12 @@ def list_command(
 
                         if file_info["has_video"] or file_info["has_strm"]:
                             downloaded_count += 1
-                            if file_info["video_file"]:
-                                video_path = output_dir / file_info["video_file"]
-                                if video_path.exists():
-                                    item_size += video_path.stat().st_size
-                            if file_info["strm_file"]:
-                                strm_path = output_dir / file_info["strm_file"]
-                                if strm_path.exists():
-                                    item_size += strm_path.stat().st_size
+                            for name in (
+                                file_info["video_file"],
+                                file_info["strm_file"],
+                            ):
+                                if name in entries:
+                                    item_size += entries[name].stat().st_size
                         else:
                             missing_count += 1
 
@@ -187,19 +192,19 @@ def list_command(
                             )
                             for srt_filename in srt_files:
                                 counted_srt_files.add(srt_filename)
-                                srt_path = output_dir / srt_filename
-                                if srt_path.exists():
-                                    item_size += srt_path.stat().st_size
+                                if srt_filename in entries:
+                                    item_size += entries[srt_filename].stat().st_size
 
                     # Scan all .srt files in directory
                     try:
-                        for srt_file in output_dir.glob("*.srt"):
+                        for name, entry in entries.items():
                             if (
-                                not srt_file.is_file()
-                                or srt_file.name in counted_srt_files
+                                not name.endswith(".srt")
+                                or name in counted_srt_files
+                                or not entry.is_file()
                             ):
                                 continue
-                            parts = srt_file.stem.split(".")
+                            parts = name[: -len(".srt")].split(".")
                             if len(parts) >= 2:
                                 lang = parts[-1]
                                 if lang == "forced" and len(parts) >= 3:
@@ -207,7 +212,7 @@ def list_command(
                             else:
                                 lang = "unknown"
                             subtitle_counts[lang] = subtitle_counts.get(lang, 0) + 1
-                            item_size += srt_file.stat().st_size
+                            item_size += entry.stat().st_size
                     except Exception as e:
                         logger.warning(
                             f"Error scanning srt files for {series.title}: {e}"
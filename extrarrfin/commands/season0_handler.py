@@ -3,6 +3,7 @@ Season 0 mode handler - Download monitored season 0 episodes
 """
 
 import logging
+from pathlib import Path
 
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
@@ -60,9 +61,8 @@ def download_season0_mode(
         progress.update(task, completed=True)
 
     # Filter to keep only those with monitored season 0 episodes
-    series_with_season0 = [
-        s for s in series_list if sonarr.has_monitored_season_zero_episodes(s)
-    ]
+    has_season0 = sonarr.batch_monitored_season_zero(series_list)
+    series_with_season0 = [s for s in series_list if has_season0[s.id]]
 
     # Filter by name/ID if specified
     if limit:
@@ -174,7 +174,9 @@ def _download_series_season0(
         console.print(f"  [red]Error:[/red] {e}")
         return total_downloads, successful_downloads, failed_downloads
 
-    # Process each episode
+    # Announce every episode, then process the batch: searches and downloads
+    # run in parallel and results are reported as they complete
+    ep_infos = {}
     for ep in to_process:
         total_downloads += 1
         ep_info = format_episode_info(
@@ -183,6 +185,7 @@ def _download_series_season0(
             ep.episode_number,
             ep.title,
         )
+        ep_infos[ep.id] = ep_info
 
         if dry_run:
             console.print(f"  [yellow]DRY RUN:[/yellow] {ep_info}")
@@ -193,14 +196,11 @@ def _download_series_season0(
         if verbose:
             console.print(f"    [dim]Search query: '{series.title} {ep.title}'[/dim]")
 
-        # Download episode
-        success, file_path, error, video_info = downloader.download_episode(
-            series,
-            ep,
-            output_dir,
-            force=force,
-            dry_run=dry_run,
-        )
+    jobs = [(series, ep, output_dir) for ep in to_process]
+    for _, ep, result in downloader.download_episodes(
+        jobs, force=force, dry_run=dry_run
+    ):
+        success, file_path, error, video_info = result
 
         if success:
             successful_downloads += 1
@@ -209,16 +209,13 @@ def _download_series_season0(
             # Create NFO file with video metadata if we have video info
             if video_info and file_path:
                 try:
-                    from pathlib import Path
-
-                    file_path_obj = Path(file_path)
-                    base_filename = file_path_obj.stem
+                    base_filename = Path(file_path).stem
                     downloader.create_nfo_file(base_filename, output_dir, video_info)
                 except Exception as e:
                     console.print(f"    [yellow]⚠ NFO creation warning:[/yellow] {e}")
         else:
             failed_downloads += 1
-            console.print(f"    [red]✗ Failed:[/red] {error}")
+            console.print(f"    [red]✗ Failed:[/red] {ep_infos[ep.id]}: {error}")
 
     # Trigger Sonarr scan if requested and if some downloads succeeded
     if not dry_run and not no_scan and successful_downloads > 0:
@@ -5,12 +5,12 @@ Tag mode handler - Download behind the scenes videos for tagged series and movie
 import logging
 import time
 
-import yt_dlp
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from extrarrfin.config import Config
 from extrarrfin.downloader import Downloader
+from extrarrfin.downloader_utils import decorrelated_jitter
 from extrarrfin.models import Movie, Series
 from extrarrfin.radarr import RadarrClient
 from extrarrfin.sonarr import SonarrClient
@@ -58,12 +58,9 @@ def download_tag_mode(
         console=console,
     ) as progress:
         task = progress.add_task("Fetching tagged series...", total=None)
-        series_list = sonarr.get_monitored_series()
+        tagged_series = sonarr.get_want_extras_series()
         progress.update(task, completed=True)
 
-    # Filter for series with the "want-extras" tag
-    tagged_series = [s for s in series_list if sonarr.has_want_extras_tag(s)]
-
     # Fetch movies with tag from Radarr (if configured)
     tagged_movies = []
     if radarr:
@@ -73,12 +70,9 @@ def download_tag_mode(
             console=console,
         ) as progress:
             task = progress.add_task("Fetching tagged movies...", total=None)
-            movie_list = radarr.get_monitored_movies()
+            tagged_movies = radarr.get_want_extras_movies()
             progress.update(task, completed=True)
 
-        # Filter for movies with the "want-extras" tag
-        tagged_movies = [m for m in movie_list if radarr.has_want_extras_tag(m)]
-
     # Apply limit filter if specified
     if limit:
         if limit.isdigit():
@@ -194,7 +188,7 @@ def _download_series_extras(
         # Check if file already exists (exclude .part files)
         existing_files = [
             f
-            for f in output_dir.glob(f"{base_filename}.*")
+            for f in downloader.find_existing_files(output_dir, base_filename)
             if not f.suffix.endswith(".part") and f.suffix != ".nfo"
         ]
         if existing_files and not force:
@@ -218,7 +212,6 @@ def _download_series_extras(
             "quiet": not verbose,
             "no_warnings": not verbose,
             "sleep_interval": 2,
-            "sleep_requests": 1,
             "sleep_subtitles": 3,
             "writesubtitles": True,
             "writeautomaticsub": True,
@@ -242,10 +235,12 @@ def _download_series_extras(
         max_retries = 5
         base_delay = 2  # Base delay in seconds
         download_success = False
+        delay = 0.0
 
         for attempt in range(max_retries):
             try:
-                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                downloader.rate_limiter.acquire()
+                with downloader.get_ydl(ydl_opts) as ydl:
                     ydl.extract_info(video_info["url"], download=True)
 
                 # Create .nfo file using centralized function
@@ -269,10 +264,10 @@ def _download_series_extras(
                     or "too many" in error_str
                 ):
                     if attempt < max_retries - 1:  # Not the last attempt
-                        # Exponential backoff: 2s, 4s, 8s, 16s...
-                        delay = base_delay * (2**attempt)
+                        # Jittered exponential backoff
+                        delay = decorrelated_jitter(delay, base_delay)
                         console.print(
-                            f"    [yellow]⚠ Rate limit error, retrying in {delay}s... (attempt {attempt + 1}/{max_retries})[/yellow]"
+                            f"    [yellow]⚠ Rate limit error, retrying in {delay:.1f}s... (attempt {attempt + 1}/{max_retries})[/yellow]"
                         )
                         time.sleep(delay)
                         continue
@@ -398,7 +393,7 @@ def _download_movie_extras(
         if not force:
             existing_files = [
                 f
-                for f in output_dir.glob(f"{base_filename}.*")
+                for f in downloader.find_existing_files(output_dir, base_filename)
                 if not f.suffix.endswith(".part") and f.suffix != ".nfo"
             ]
             if existing_files:
@@ -440,8 +435,6 @@ def _download_movie_extras(
 
             # Add delay to avoid rate limiting
             if not dry_run:
-                import time
-
                 time.sleep(3)  # Wait 3 seconds between downloads
         else:
             # Check if it's a rate limit error
@@ -39,9 +39,8 @@ def test_command(
         monitored = [s for s in series if s.monitored]
         console.print(f"Monitored series: {len(monitored)}")
 
-        with_season0 = [
-            s for s in monitored if sonarr.has_monitored_season_zero_episodes(s)
-        ]
+        has_season0 = sonarr.batch_monitored_season_zero(monitored)
+        with_season0 = [s for s in monitored if has_season0[s.id]]
         console.print(f"With monitored season 0 episodes: {len(with_season0)}")
 
         with_tag = [s for s in monitored if sonarr.has_want_extras_tag(s)]
@@ -78,8 +77,9 @@ def test_command(
             console.print(f"URL: {jf_url}")
 
             try:
-                jellyfin = JellyfinClient(jf_url, jf_api_key)
-                if jellyfin.test_connection():
+                with JellyfinClient(jf_url, jf_api_key) as jellyfin:
+                    connected = jellyfin.test_connection()
+                if connected:
                     console.print("[green]✓ Jellyfin connection successful![/green]")
                 else:
                     console.print("[red]✗ Jellyfin connection failed[/red]")
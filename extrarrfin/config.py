@@ -43,6 +43,13 @@ class Config:
     # YouTube search options
     min_score: float = 50.0  # Minimum score to accept a video match
     youtube_search_results: int = 10  # Number of YouTube results to fetch (5-20)
+    # On-disk caches (defaults to ~/.cache/extrarrfin)
+    cache_directory: str | None = None
+    search_cache_days: int = 7  # How long YouTube search results are reused (0 = off)
+    # Number of episodes downloaded concurrently (1 = sequential)
+    parallel_downloads: int = 3
+    # Number of YouTube searches run concurrently
+    parallel_searches: int = 4
     # Movie extras search keywords (configurable)
     movie_extras_keywords: list = field(
         default_factory=lambda: [
@@ -2,24 +2,163 @@
 Download module via yt-dlp with Jellyfin formatting
 """
 
+import contextlib
+import copy
+import json
 import logging
+import os
 import re
+import sqlite3
 import subprocess
+import threading
+import time
 import urllib.parse
+from collections import OrderedDict, defaultdict
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
+from types import MappingProxyType
 from typing import Tuple
 
 import requests
 import yt_dlp
 
+from .downloader_utils.cache import SearchCache
 from .downloader_utils.nfo import NFOWriter
 from .downloader_utils.paths import PathManager
+from .downloader_utils.rate_limit import TokenBucket, decorrelated_jitter
 from .downloader_utils.strm import STRMWriter
 from .models import Episode, Movie, Series
 from .scorer import ScoringWeights, VideoScorer
+from .utils import get_cache_directory
 
 logger = logging.getLogger(__name__)
 
+# Subtitle conversion postprocessor shared by every subtitle-only download
+_SRT_PP = ({"key": "FFmpegSubtitlesConvertor", "format": "srt"},)
+
+# Fields of a yt-dlp info dict that callers actually consume (NFO metadata).
+# Everything else (formats, captions, thumbnails, heatmap...) is dropped so
+# batch runs don't keep hundreds of KB per video alive.
+_INFO_KEEP = frozenset(
+    {
+        "id",
+        "title",
+        "url",
+        "webpage_url",
+        "channel",
+        "uploader",
+        "description",
+        "duration",
+        "view_count",
+        "upload_date",
+        "thumbnail",
+    }
+)
+
+# Fields kept in the per-run info cache: the NFO fields above plus the
+# subtitle listings used to pick which languages to request
+_INFO_CACHE_KEEP = _INFO_KEEP | {"subtitles", "automatic_captions"}
+
+# Maximum number of videos kept in the per-run info cache
+_INFO_CACHE_SIZE = 512
+
+# Existing files kept when force re-downloading: subtitles are regenerated
+# in STRM mode and overwritten by yt-dlp when downloading
+_FORCE_KEEP_SUFFIXES = frozenset({".srt"})
+
+# yt-dlp options that may differ between two uses of the same pooled
+# YoutubeDL instance: they are read at processing time (the format selector
+# is rebuilt on change); everything else is fixed at init
+_PER_CALL_YDL_OPTS = frozenset(
+    {"format", "outtmpl", "subtitleslangs", "writesubtitles", "writeautomaticsub"}
+)
+
+_YOUTUBE_ID_RE = re.compile(r"[?&]v=([\w-]{11})")
+
+# Language tag at the end of a subtitle stem: ".fr", ".eng", ".en-US", ".zh-Hans"
+_SUBTITLE_LANG_RE = re.compile(r"\.([A-Za-z]{2,3}(?:-[A-Za-z0-9]{2,4})?)$")
+# "SeriesName - S00E01" part of an episode filename, used as the index key
+# (two episode digits, so E1xx files group with their E1x prefix)
+_EPISODE_KEY_RE = re.compile(r" - S\d\dE\d\d")
+# Single-file (progressive) format for STRM streams
+_STRM_FORMAT = "best[ext=mp4]/best"
+_VIDEO_EXTENSIONS = frozenset({".mp4", ".mkv", ".avi", ".mov", ".wmv", ".flv", ".webm"})
+# Short episode titles with digits or punctuation are searched as an exact
+# phrase; longer ones are distinctive enough on their own
+_PHRASE_TITLE_RE = re.compile(r"[^\w\s]|\d")
+_PHRASE_TITLE_MAX_WORDS = 4
+
+# Titles of other productions that make an extras match suspicious
+_OTHER_TITLES_KEYWORDS = frozenset(
+    {
+        "rapunzel",
+        "tangled",
+        "white collar",
+        "the wanted",
+        "most wanted",
+        "america's most wanted",
+        "wanted man",
+    }
+)
+
+# Keywords that mark a video as movie extras material
+_EXTRAS_KEYWORDS = frozenset(
+    {
+        "behind the scenes",
+        "making of",
+        "featurette",
+        "interview",
+        "deleted",
+        "bloopers",
+        "bts",
+        "on set",
+        "alternate",
+        "gag reel",
+        "vfx",
+        "special effect",
+        "visual effect",
+    }
+)
+
+# Keywords of unrelated content (reviews, trailers, clips...)
+_PENALTY_KEYWORDS = frozenset(
+    {
+        "gameplay",
+        "walkthrough",
+        "reaction",
+        "review",
+        "trailer",
+        "teaser",
+        "music video",
+        "official video",
+        "lyric",
+        "movie clip",
+        "scene",
+        "all action",
+        "then and now",
+        "cast then",
+        "best scenes",
+        "full movie",
+        "movie mistakes",
+        "where to watch",
+        "how to watch",
+        "explained",
+        "breakdown",
+        "rampage",
+        "analysis",
+        "the guns of",
+        "the art of",
+        "(action)",
+        "(horror)",
+        "(comedy)",
+        "(drama)",
+        "full hd",
+        "1080p",
+        "4k uhd",
+    }
+)
+
 
 class Downloader:
     """YouTube video downloader with Jellyfin-compatible formatting"""
@@ -34,18 +173,27 @@ class Downloader:
         min_score: float = 50.0,
         youtube_search_results: int = 10,
         scoring_weights: ScoringWeights | None = None,
+        cache_directory: str | Path | None = None,
+        search_cache_days: int = 7,
+        parallel_downloads: int = 3,
+        parallel_searches: int = 4,
     ):
         self.format_string = format_string
         self.subtitle_languages = subtitle_languages or [
             "fr",
             "en",
         ]
+        # Built once: intersected with each video's languages in the pre-check
+        self._subtitle_langs = frozenset(self.subtitle_languages)
         self.download_all_subtitles = download_all_subtitles
         self.use_strm_files = use_strm_files
         self.verbose = verbose
         self.youtube_search_results = max(
             3, min(20, youtube_search_results)
         )  # Clamp between 3 and 20
+        self.parallel_downloads = max(1, parallel_downloads)
+        # Concurrent YouTube searches in download_episodes()
+        self.parallel_searches = max(1, parallel_searches)
 
         # Initialize video scorer with custom weights if provided
         self.scorer = VideoScorer(
@@ -54,11 +202,76 @@ class Downloader:
             verbose=verbose,
         )
 
+        # Global yt-dlp policy shared by every quiet extraction; per-call
+        # options are layered on top of this read-only base
+        self._base_ydl_opts = MappingProxyType(
+            {
+                "quiet": True,
+                "no_warnings": True,
+            }
+        )
+
+        # Shared YouTube request budget (~30 requests/min, bursts of 10),
+        # replacing yt-dlp's fixed 1s sleep between every request
+        self.rate_limiter = TokenBucket(capacity=10, refill_per_sec=30 / 60)
+
         # Initialize helper classes
         self._path_manager = PathManager()
         self._nfo_writer = NFOWriter()
         self._strm_writer = STRMWriter()
 
+        # Persistent cache of YouTube search results (disabled when days <= 0)
+        self.cache_directory = get_cache_directory(cache_directory)
+        self._search_cache: SearchCache | None = None
+        if search_cache_days > 0:
+            try:
+                self._search_cache = SearchCache(
+                    self.cache_directory / "search_cache.sqlite3",
+                    ttl=search_cache_days * 24 * 3600,
+                )
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"Search cache disabled: {e}")
+
+        # Subtitle languages seen per video ID, persisted between runs so
+        # download_video_from_url can skip its pre-check request
+        self._subs_cache_ttl = search_cache_days * 24 * 3600
+        self._subs_cache_path = self.cache_directory / "subs.json"
+        self._subs_cache: dict[str, dict] = {}
+        self._subs_cache_lock = threading.Lock()
+        if self._subs_cache_ttl > 0:
+            try:
+                with open(self._subs_cache_path, "r", encoding="utf-8") as f:
+                    self._subs_cache = json.load(f)
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable subtitle cache: {e}")
+
+        # Per-run memo of extract_info() results, keyed by video ID, so the
+        # same video is not extracted again for validation, dry-run and the
+        # subtitle check
+        self._info_cache: OrderedDict[str, dict] = OrderedDict()
+        self._info_cache_lock = threading.Lock()
+
+        # Keep-alive HTTP session for the theme sources (ThemerrDB,
+        # TelevisionTunes). yt-dlp traffic already reuses connections through
+        # the pooled YoutubeDL instances below.
+        self._http = requests.Session()
+
+        # Idle YoutubeDL instances, keyed by their fixed options, so player JS,
+        # signature decoders and cookies are reused from one video to the next
+        self._ydl_pool: dict[str, list[yt_dlp.YoutubeDL]] = {}
+        self._ydl_pool_lock = threading.Lock()
+
+        # Directory listings reused across episode checks, keyed by directory
+        # and validated against its mtime (any create/delete bumps it)
+        self._dir_index: dict[Path, tuple[int, list[os.DirEntry]]] = {}
+        self._dir_index_lock = threading.Lock()
+        # Episode-prefix index of each cached listing (see index_directory)
+        self._prefix_index: dict[
+            Path, tuple[list[os.DirEntry], dict[str, list[os.DirEntry]]]
+        ] = {}
+
     # Delegate to PathManager
     def sanitize_filename(self, filename: str) -> str:
         """Clean a filename to make it compatible"""
@@ -166,12 +379,12 @@ class Downloader:
             ],
             "quiet": not self.verbose,
             "no_warnings": not self.verbose,
-            "sleep_requests": 1,
             "nocheckcertificate": nocheckcertificate,
         }
 
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        with self.get_ydl(ydl_opts) as ydl:
             try:
+                self.rate_limiter.acquire()
                 ydl.download([url])
             except Exception as ydl_err:
                 logger.debug(f"yt-dlp download error: {ydl_err}")
@@ -250,7 +463,7 @@ class Downloader:
             return False, None, "ThemerrDB: no TVDB/TMDB ID available"
 
         try:
-            resp = requests.get(lookup_url, timeout=10)
+            resp = self._http.get(lookup_url, timeout=10)
             if resp.status_code != 200:
                 return (
                     False,
@@ -302,7 +515,9 @@ class Downloader:
         )
 
         try:
-            resp = requests.get(search_url, timeout=10, headers=_HEADERS, verify=False)
+            resp = self._http.get(
+                search_url, timeout=10, headers=_HEADERS, verify=False
+            )
             if resp.status_code != 200:
                 return (
                     False,
@@ -371,7 +586,7 @@ class Downloader:
                 return True, str(theme_file), None
 
             # Scrape the show page for a direct MP3 URL
-            page_resp = requests.get(
+            page_resp = self._http.get(
                 show_url, timeout=10, headers=_HEADERS, verify=False
             )
             if page_resp.status_code != 200:
@@ -396,7 +611,7 @@ class Downloader:
             output_dir.mkdir(parents=True, exist_ok=True)
             theme_file = output_dir / "theme.mp3"
 
-            audio_resp = requests.get(
+            audio_resp = self._http.get(
                 mp3_url, timeout=30, headers=_HEADERS, stream=True, verify=False
             )
             if audio_resp.status_code != 200:
@@ -443,11 +658,9 @@ class Downloader:
             logger.info(f"Searching YouTube for theme: {query}")
 
         ydl_search_opts = {
-            "quiet": True,
-            "no_warnings": True,
+            **self._base_ydl_opts,
             "extract_flat": True,
             "default_search": f"ytsearch{self.youtube_search_results}",
-            "sleep_requests": 1,
         }
 
         try:
@@ -455,7 +668,8 @@ class Downloader:
             all_entries: list[dict] = []
             seen_ids: set[str] = set()
 
-            with yt_dlp.YoutubeDL(ydl_search_opts) as ydl:
+            with self.get_ydl(ydl_search_opts) as ydl:
+                self.rate_limiter.acquire()
                 result = ydl.extract_info(
                     f"ytsearch{self.youtube_search_results}:{query}", download=False
                 )
@@ -471,7 +685,8 @@ class Downloader:
             if self.verbose:
                 logger.info(f"[VERBOSE] YouTube theme secondary search: '{query2}'")
             try:
-                with yt_dlp.YoutubeDL(ydl_search_opts) as ydl2:
+                with self.get_ydl(ydl_search_opts) as ydl2:
+                    self.rate_limiter.acquire()
                     result2 = ydl2.extract_info(
                         f"ytsearch{self.youtube_search_results}:{query2}",
                         download=False,
@@ -491,7 +706,8 @@ class Downloader:
             if self.verbose:
                 logger.info(f"[VERBOSE] YouTube theme tertiary search: '{query3}'")
             try:
-                with yt_dlp.YoutubeDL(ydl_search_opts) as ydl3:
+                with self.get_ydl(ydl_search_opts) as ydl3:
+                    self.rate_limiter.acquire()
                     result3 = ydl3.extract_info(
                         f"ytsearch{self.youtube_search_results}:{query3}",
                         download=False,
@@ -512,7 +728,8 @@ class Downloader:
                         f"[VERBOSE] YouTube theme quaternary search: '{query4}'"
                     )
                 try:
-                    with yt_dlp.YoutubeDL(ydl_search_opts) as ydl4:
+                    with self.get_ydl(ydl_search_opts) as ydl4:
+                        self.rate_limiter.acquire()
                         result4 = ydl4.extract_info(
                             f"ytsearch{self.youtube_search_results}:{query4}",
                             download=False,
@@ -531,7 +748,8 @@ class Downloader:
             if self.verbose:
                 logger.info(f"[VERBOSE] YouTube theme quinary search: '{query5}'")
             try:
-                with yt_dlp.YoutubeDL(ydl_search_opts) as ydl5:
+                with self.get_ydl(ydl_search_opts) as ydl5:
+                    self.rate_limiter.acquire()
                     result5 = ydl5.extract_info(
                         f"ytsearch{self.youtube_search_results}:{query5}",
                         download=False,
@@ -697,16 +915,349 @@ class Downloader:
         """Create a .strm file containing the YouTube URL"""
         return STRMWriter.create_strm_file(youtube_url, base_filename, output_directory)
 
+    @staticmethod
+    def _prune_info(info: dict) -> dict:
+        """Keep only the info dict fields consumed by callers"""
+        return {k: info[k] for k in _INFO_KEEP if k in info}
+
+    @contextlib.contextmanager
+    def get_ydl(self, opts: dict) -> Iterator[yt_dlp.YoutubeDL]:
+        """
+        Borrow a YoutubeDL instance from the pool (created on first use)
+
+        Instances are shared between calls with the same fixed options (the
+        values of the _PER_CALL_YDL_OPTS options are applied to the borrowed
+        instance instead).
+        An instance is used by one caller at a time.
+
+        Args:
+            opts: yt-dlp options
+        """
+        key = repr(
+            sorted((k, None if k in _PER_CALL_YDL_OPTS else v) for k, v in opts.items())
+        )
+        with self._ydl_pool_lock:
+            idle = self._ydl_pool.setdefault(key, [])
+            ydl = idle.pop() if idle else None
+        if ydl is None:
+            # yt-dlp's own cache (signature functions, player data) lives in
+            # the project cache directory unless the caller overrides it
+            ydl = yt_dlp.YoutubeDL(
+                {"cachedir": str(self.cache_directory / "yt-dlp"), **opts}
+            )
+        else:
+            for name in _PER_CALL_YDL_OPTS.intersection(opts):
+                if name == "outtmpl" and isinstance(opts[name], str):
+                    ydl.params[name] = {"default": opts[name]}
+                elif name == "format":
+                    if ydl.params.get("format") != opts["format"]:
+                        # Fallback formats reuse the instance: only the
+                        # selector needs compiling, not a new YoutubeDL
+                        ydl.params["format"] = opts["format"]
+                        ydl.format_selector = ydl.build_format_selector(opts["format"])
+                else:
+                    ydl.params[name] = opts[name]
+        try:
+            yield ydl
+        finally:
+            with self._ydl_pool_lock:
+                self._ydl_pool[key].append(ydl)
+
+    def close(self) -> None:
+        """Close pooled YoutubeDL instances, the HTTP session and the search cache"""
+        with self._ydl_pool_lock:
+            pooled = [ydl for idle in self._ydl_pool.values() for ydl in idle]
+            self._ydl_pool.clear()
+        for ydl in pooled:
+            ydl.close()
+        self._http.close()
+        if self._search_cache is not None:
+            self._search_cache.close()
+            self._search_cache = None
+
+    def clear_cache(self) -> None:
+        """
+        Forget the per-run caches (directory listings, extracted video info,
+        NFO video IDs)
+
+        Called between scheduled runs so a long-lived Downloader starts each
+        run from the current state of the library and of YouTube; the
+        on-disk search and subtitle caches keep their own expiry.
+        """
+        with self._dir_index_lock:
+            self._dir_index.clear()
+            self._prefix_index.clear()
+        with self._info_cache_lock:
+            self._info_cache.clear()
+        PathManager.ensure_directory.cache_clear()
+        NFOWriter.clear_nfo_cache()
+
+    @staticmethod
+    def _video_key(url: str) -> str:
+        """Key of the per-run info cache: the YouTube video ID, else the URL"""
+        match = _YOUTUBE_ID_RE.search(url)
+        return match.group(1) if match else url
+
+    def _extract_info(self, url: str) -> dict | None:
+        """
+        Extract the full video info (no download) and refresh the info cache
+
+        The returned dict is complete (formats included) so it can be handed
+        back to yt-dlp with process_ie_result() to download without fetching
+        the video page again.
+
+        Args:
+            url: YouTube video URL
+
+        Returns:
+            Full info dict, or None if yt-dlp returned nothing
+        """
+        opts = {**self._base_ydl_opts, "skip_download": True}
+        with self.get_ydl(opts) as ydl:
+            self.rate_limiter.acquire()
+            info = ydl.extract_info(url, download=False)
+        if not info:
+            return None
+
+        key = self._video_key(url)
+        with self._info_cache_lock:
+            self._info_cache[key] = {k: info[k] for k in _INFO_CACHE_KEEP if k in info}
+            self._info_cache.move_to_end(key)
+            if len(self._info_cache) > _INFO_CACHE_SIZE:
+                self._info_cache.popitem(last=False)
+        return info
+
+    def _get_info(self, url: str) -> dict | None:
+        """
+        Extract video info (no download), memoized per video ID for this run
+
+        Only the fields in _INFO_CACHE_KEEP are kept; format selection is not
+        part of the cached result.
+
+        Args:
+            url: YouTube video URL
+
+        Returns:
+            Pruned info dict, or None if yt-dlp returned nothing
+        """
+        key = self._video_key(url)
+        with self._info_cache_lock:
+            cached = self._info_cache.get(key)
+            if cached is not None:
+                self._info_cache.move_to_end(key)
+                return cached
+
+        if not self._extract_info(url):
+            return None
+        with self._info_cache_lock:
+            return self._info_cache.get(key)
+
+    @staticmethod
+    def _subtitle_langs_of(info: dict) -> set[str]:
+        """Languages of the manual and automatic subtitles of a video"""
+        langs = set(info.get("subtitles") or ())
+        langs.update(info.get("automatic_captions") or ())
+        return langs
+
+    def _get_cached_subtitles(self, video_id: str) -> set[str] | None:
+        """Return the subtitle languages recorded for a video, None if unknown"""
+        if self._subs_cache_ttl <= 0:
+            return None
+        with self._subs_cache_lock:
+            entry = self._subs_cache.get(video_id)
+        if not entry or entry.get("ts", 0) < time.time() - self._subs_cache_ttl:
+            return None
+        return set(entry.get("langs", []))
+
+    def _set_cached_subtitles(self, video_id: str, langs: set[str]) -> None:
+        """Record the subtitle languages of a video and persist the cache"""
+        if self._subs_cache_ttl <= 0:
+            return
+        with self._subs_cache_lock:
+            self._subs_cache[video_id] = {
+                "langs": sorted(langs),
+                "ts": int(time.time()),
+            }
+            tmp_path = self._subs_cache_path.with_suffix(".json.tmp")
+            try:
+                self._subs_cache_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(self._subs_cache, f)
+                os.replace(tmp_path, self._subs_cache_path)
+            except OSError as e:
+                logger.warning(f"Could not save subtitle cache: {e}")
+
+    def _list_directory(self, directory: Path) -> list[os.DirEntry]:
+        """
+        List a directory with a single scandir, reused while it is unchanged
+
+        Args:
+            directory: Directory to list
+
+        Returns:
+            Directory entries (empty if the directory can't be read)
+        """
+        try:
+            mtime = os.stat(directory).st_mtime_ns
+        except OSError:
+            return []
+
+        with self._dir_index_lock:
+            cached = self._dir_index.get(directory)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            return []
+        with self._dir_index_lock:
+            self._dir_index[directory] = (mtime, entries)
+        return entries
+
+    def _forget_directory(self, directory: Path) -> None:
+        """Drop the cached listing of a directory after modifying it"""
+        with self._dir_index_lock:
+            self._dir_index.pop(directory, None)
+            self._prefix_index.pop(directory, None)
+
+    def index_directory(self, directory: Path) -> dict[str, list[os.DirEntry]]:
+        """
+        Group a directory's entries by episode ("SeriesName - S00E01" prefix)
+
+        Built once per directory listing, so checking every episode of a
+        series is one dict lookup per episode instead of a scan of the whole
+        directory each time. Entries without an episode prefix are grouped
+        under "".
+
+        Args:
+            directory: Directory to index
+
+        Returns:
+            Dictionary mapping episode prefixes to directory entries
+        """
+        entries = self._list_directory(directory)
+        with self._dir_index_lock:
+            cached = self._prefix_index.get(directory)
+        # The index is only valid for the listing it was built from
+        if cached is not None and cached[0] is entries:
+            return cached[1]
+
+        index: dict[str, list[os.DirEntry]] = {}
+        for entry in entries:
+            match = _EPISODE_KEY_RE.search(entry.name)
+            key = entry.name[: match.end()] if match else ""
+            index.setdefault(key, []).append(entry)
+        with self._dir_index_lock:
+            self._prefix_index[directory] = (entries, index)
+        return index
+
+    def directory_entries(self, directory: Path) -> dict[str, os.DirEntry]:
+        """
+        Map the file names of a directory to their entries
+
+        Uses the cached listing, so presence checks on many names are set
+        lookups instead of one stat() call each; DirEntry.stat() results
+        are cached by the entry itself.
+
+        Args:
+            directory: Directory to list
+
+        Returns:
+            Dictionary mapping file names to directory entries
+        """
+        return {entry.name: entry for entry in self._list_directory(directory)}
+
+    def _episode_entries(self, directory: Path, prefix: str) -> list[os.DirEntry]:
+        """Directory entries that may start with *prefix* (a superset)"""
+        match = _EPISODE_KEY_RE.search(prefix)
+        if not match:
+            return self._list_directory(directory)
+        return self.index_directory(directory).get(prefix[: match.end()], [])
+
+    def find_existing_files(self, directory: Path, base_filename: str) -> list[Path]:
+        """
+        Find the files named ``<base_filename>.*`` in a directory
+
+        Equivalent to ``directory.glob(f"{base_filename}.*")`` without the
+        per-call directory scan (and without glob special characters in
+        titles being interpreted as patterns).
+        """
+        return list(self._iter_existing_files(directory, base_filename))
+
+    def _iter_existing_files(
+        self, directory: Path, base_filename: str
+    ) -> Iterator[Path]:
+        """Lazily yield the files named ``<base_filename>.*`` in a directory"""
+        prefix = base_filename + "."
+        for entry in self._episode_entries(directory, base_filename):
+            if entry.name.startswith(prefix):
+                yield Path(entry.path)
+
+    def _delete_existing_files(
+        self, existing_files: list[Path], output_directory: Path, dry_run: bool
+    ) -> None:
+        """Delete the files of an item before a forced re-download"""
+        to_delete = [f for f in existing_files if f.suffix not in _FORCE_KEEP_SUFFIXES]
+        if dry_run:
+            for existing_file in to_delete:
+                logger.info(
+                    f"DRY RUN: Would delete existing file: {existing_file.name}"
+                )
+            return
+
+        def _unlink(existing_file: Path) -> None:
+            logger.info(f"Deleting existing file: {existing_file.name}")
+            try:
+                os.unlink(existing_file)
+            except OSError as e:
+                logger.warning(f"Could not delete {existing_file.name}: {e}")
+
+        if len(to_delete) > 1:
+            # Issue the unlinks concurrently: on network shares (NFS/SMB) each
+            # one is a server round-trip, which would otherwise be serialized
+            with ThreadPoolExecutor(max_workers=min(8, len(to_delete))) as executor:
+                list(executor.map(_unlink, to_delete))
+        else:
+            for existing_file in to_delete:
+                _unlink(existing_file)
+        self._forget_directory(output_directory)
+
     @staticmethod
     def _cleanup_part_files(output_directory: Path, base_filename: str) -> None:
         """Clean up any .part files left behind after a failed download"""
+        # Plain scandir + prefix/suffix check: avoids building a Path object
+        # per directory entry and the fnmatch translation done by glob()
+        prefix = base_filename + "."
+        suffix = ".part"
         try:
-            for part_file in output_directory.glob(f"{base_filename}.*.part"):
-                logger.info(f"Cleaning up incomplete file: {part_file.name}")
-                part_file.unlink()
+            with os.scandir(output_directory) as it:
+                for entry in it:
+                    name = entry.name
+                    if name.startswith(prefix) and name.endswith(suffix):
+                        logger.info(f"Cleaning up incomplete file: {name}")
+                        try:
+                            os.unlink(entry.path)
+                        except OSError as e:
+                            logger.warning(f"Could not remove {name}: {e}")
         except Exception as e:
             logger.warning(f"Could not clean up .part files: {e}")
 
+    def _search_cache_get(self, key: str) -> str | None:
+        """Return a cached search result, or None if not cached"""
+        if self._search_cache is None:
+            return None
+        cached = self._search_cache.get(key)
+        if cached is not None and self.verbose:
+            logger.info("[VERBOSE] Using cached YouTube search result")
+        return cached
+
+    def _search_cache_set(self, key: str, result: str) -> None:
+        """Store a search result (empty string records a miss)"""
+        if self._search_cache is not None:
+            self._search_cache.set(key, self.youtube_search_results, result)
+
     def _clean_episode_title_for_search(self, title: str) -> str:
         """
         Clean episode title before YouTube search to improve results
@@ -743,112 +1294,98 @@ class Downloader:
         Returns the URL of the best matching video found
 
         First tries: series title + episode title
-        If not found, tries: episode title only
+        If no candidate reaches min_score, tries: episode title only
         Uses a scoring system to find the best match
+        Results (including misses) are cached on disk between runs
         """
+        if not episode.title or episode.title == "TBA":
+            return None
+
+        # Clean episode title before search to improve results
+        cleaned_title = self._clean_episode_title_for_search(episode.title)
+        # Keyed by the episode identity plus everything that changes the pick
+        cache_key = SearchCache.make_key(
+            "episode",
+            self.youtube_search_results,
+            self.scorer.min_score,
+            series.title,
+            f"S{episode.season_number:02d}E{episode.episode_number:02d}",
+            episode.title,
+        )
+        cached = self._search_cache_get(cache_key)
+        if cached is not None:
+            return cached or None
+
+        search_failed = False
         ydl_opts = {
-            "quiet": True,
-            "no_warnings": True,
+            **self._base_ydl_opts,
             "extract_flat": "in_playlist",  # Get metadata for each video
             "default_search": f"ytsearch{self.youtube_search_results}",
-            "sleep_requests": 1,  # Sleep 1 second between requests to avoid 429 errors
         }
 
-        # First attempt: series title + episode title
-        if episode.title and episode.title != "TBA":
-            # Clean episode title before search to improve results
-            cleaned_title = self._clean_episode_title_for_search(episode.title)
-            query_with_series = f"{series.title} {cleaned_title}"
+        # Series title + episode title first; the episode title alone is only
+        # searched when that found nothing scoring above min_score (the
+        # scorer rejects weaker candidates), so a good first match costs a
+        # single search request
+        # On its own, a title like "Part 2" or "Q&A" is only distinctive as
+        # an exact phrase, so let YouTube's ranking do that filtering
+        episode_query = episode.title
+        if (
+            len(episode_query.split()) <= _PHRASE_TITLE_MAX_WORDS
+            and _PHRASE_TITLE_RE.search(episode_query)
+            and '"' not in episode_query
+        ):
+            episode_query = f'"{episode_query}"'
+        queries = (
+            ("with series", f"{series.title} {cleaned_title}"),
+            ("episode only", episode_query),
+        )
+        for label, query in queries:
             if self.verbose:
-                logger.info(f"[VERBOSE] YouTube search query: '{query_with_series}'")
+                logger.info("[VERBOSE] YouTube search query (%s): '%s'", label, query)
             else:
-                logger.info(f"YouTube search (with series): {query_with_series}")
+                logger.info("YouTube search (%s): %s", label, query)
 
             try:
-                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                    search_url = (
-                        f"ytsearch{self.youtube_search_results}:{query_with_series}"
-                    )
+                with self.get_ydl(ydl_opts) as ydl:
+                    search_url = f"ytsearch{self.youtube_search_results}:{query}"
                     if self.verbose:
-                        logger.info(f"[VERBOSE] Full search URL: {search_url}")
+                        logger.info("[VERBOSE] Full search URL: %s", search_url)
 
+                    self.rate_limiter.acquire()
                     result = ydl.extract_info(search_url, download=False)
+            except Exception as e:
+                search_failed = True
+                logger.error("Error during YouTube search: %s", e)
+                continue
 
-                    if result and "entries" in result and result["entries"]:
-                        # Score each result to find the best match
-                        best_video = self.scorer.score_and_select_video(
-                            result["entries"], series, episode.title
-                        )
+            if not (result and result.get("entries")):
+                continue
 
-                        if best_video:
-                            video_url = (
-                                f"https://www.youtube.com/watch?v={best_video['id']}"
-                            )
-                            if self.verbose:
-                                logger.info(
-                                    f"[VERBOSE] Video found: {best_video.get('title')}"
-                                )
-                                logger.info(f"[VERBOSE] Video URL: {video_url}")
-                                logger.info(
-                                    f"[VERBOSE] Match score: {best_video.get('_score', 0):.2f}"
-                                )
-                            else:
-                                logger.info(
-                                    f"Video found: {best_video.get('title')} - {video_url}"
-                                )
-                            return video_url
-            except Exception as e:
-                logger.error(f"Error during YouTube search: {e}")
+            # Score each result to find the best match
+            best_video = self.scorer.score_and_select_video(
+                result["entries"], series, episode.title
+            )
+            if not best_video:
+                continue
 
-            # Second attempt: episode title only
-            query_episode_only = episode.title
+            video_url = f"https://www.youtube.com/watch?v={best_video['id']}"
             if self.verbose:
-                logger.info(
-                    f"[VERBOSE] YouTube search query (episode only): '{query_episode_only}'"
-                )
+                logger.info("[VERBOSE] Video found: %s", best_video.get("title"))
+                logger.info("[VERBOSE] Video URL: %s", video_url)
+                logger.info("[VERBOSE] Match score: %.2f", best_video.get("_score", 0))
             else:
-                logger.info(f"YouTube search (episode only): {query_episode_only}")
-
-            try:
-                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                    search_url = (
-                        f"ytsearch{self.youtube_search_results}:{query_episode_only}"
-                    )
-                    if self.verbose:
-                        logger.info(f"[VERBOSE] Full search URL: {search_url}")
-
-                    result = ydl.extract_info(search_url, download=False)
-
-                    if result and "entries" in result and result["entries"]:
-                        # Score each result to find the best match
-                        best_video = self.scorer.score_and_select_video(
-                            result["entries"], series, episode.title
-                        )
-
-                        if best_video:
-                            video_url = (
-                                f"https://www.youtube.com/watch?v={best_video['id']}"
-                            )
-                            if self.verbose:
-                                logger.info(
-                                    f"[VERBOSE] Video found: {best_video.get('title')}"
-                                )
-                                logger.info(f"[VERBOSE] Video URL: {video_url}")
-                                logger.info(
-                                    f"[VERBOSE] Match score: {best_video.get('_score', 0):.2f}"
-                                )
-                            else:
-                                logger.info(
-                                    f"Video found: {best_video.get('title')} - {video_url}"
-                                )
-                            return video_url
-            except Exception as e:
-                logger.error(f"Error during YouTube search: {e}")
+                logger.info("Video found: %s - %s", best_video.get("title"), video_url)
+            self._search_cache_set(cache_key, video_url)
+            return video_url
 
+        # Only remember the miss if both searches actually completed
+        if not search_failed:
+            self._search_cache_set(cache_key, "")
         return None
 
     def search_youtube_behind_scenes(
-        self, series: Series, exclude_ids: set[str] | None = None
+        self, series: Series, exclude_ids: Iterable[str] | None = None
     ) -> list[dict] | None:
         """
         Search for behind the scenes videos on YouTube
@@ -861,45 +1398,55 @@ class Downloader:
             series: Series object to search for
             exclude_ids: Set of video IDs to exclude (already downloaded)
         """
-        if exclude_ids is None:
-            exclude_ids = set()
+        # Freeze once: O(1) lookups and a stable snapshot for the cache key
+        exclude_ids = frozenset(exclude_ids or ())
+
+        cache_key = SearchCache.make_key(
+            "behind_scenes", 15, series.title, sorted(exclude_ids)
+        )
+        cached = self._search_cache_get(cache_key)
+        if cached is not None:
+            # An empty string is a cached miss (see SearchCache)
+            return json.loads(cached) if cached else None
 
         ydl_opts = {
-            "quiet": True,
-            "no_warnings": True,
-            "extract_flat": True,
+            **self._base_ydl_opts,
+            "extract_flat": "in_playlist",  # Get metadata for each video
             "default_search": "ytsearch15",  # Get top 15 results for better matching
-            "sleep_requests": 1,  # Sleep 1 second between requests to avoid 429 errors
         }
 
         query = f"{series.title} - behind the scenes"
         if self.verbose:
-            logger.info(f"[VERBOSE] YouTube search query: '{query}'")
+            logger.info("[VERBOSE] YouTube search query: '%s'", query)
         else:
-            logger.info(f"YouTube search (behind the scenes): {query}")
+            logger.info("YouTube search (behind the scenes): %s", query)
 
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            with self.get_ydl(ydl_opts) as ydl:
                 search_url = f"ytsearch15:{query}"
                 if self.verbose:
-                    logger.info(f"[VERBOSE] Full search URL: {search_url}")
+                    logger.info("[VERBOSE] Full search URL: %s", search_url)
 
+                self.rate_limiter.acquire()
                 result = ydl.extract_info(search_url, download=False)
 
                 if result and "entries" in result and result["entries"]:
                     # Filter out already downloaded videos before scoring
-                    filtered_entries = [
-                        entry
-                        for entry in result["entries"]
-                        if entry
-                        and entry.get("id")
-                        and entry.get("id") not in exclude_ids
-                    ]
-
-                    if self.verbose and len(filtered_entries) < len(result["entries"]):
-                        excluded_count = len(result["entries"]) - len(filtered_entries)
+                    # (single pass that also counts the exclusions)
+                    filtered_entries = []
+                    excluded_count = 0
+                    for entry in result["entries"]:
+                        if not entry or not entry.get("id"):
+                            continue
+                        if entry["id"] in exclude_ids:
+                            excluded_count += 1
+                            continue
+                        filtered_entries.append(entry)
+
+                    if self.verbose and excluded_count:
                         logger.info(
-                            f"[VERBOSE] Excluded {excluded_count} already downloaded videos"
+                            "[VERBOSE] Excluded %s already downloaded videos",
+                            excluded_count,
                         )
 
                     # Score each result to find the best matches
@@ -927,20 +1474,26 @@ class Downloader:
                             video_list.append(video_info)
                             if self.verbose:
                                 logger.info(
-                                    f"[VERBOSE] Video found: {video.get('title')}"
+                                    "[VERBOSE] Video found: %s", video.get("title")
                                 )
-                                logger.info(f"[VERBOSE] Video URL: {video_url}")
+                                logger.info("[VERBOSE] Video URL: %s", video_url)
                                 logger.info(
-                                    f"[VERBOSE] Match score: {video.get('_score', 0):.2f}"
+                                    "[VERBOSE] Match score: %.2f",
+                                    video.get("_score", 0),
                                 )
                             else:
                                 logger.info(
-                                    f"Video found: {video.get('title')} - {video_url}"
+                                    "Video found: %s - %s",
+                                    video.get("title"),
+                                    video_url,
                                 )
+                        self._search_cache_set(cache_key, json.dumps(video_list))
                         return video_list
         except Exception as e:
-            logger.error(f"Error during YouTube search: {e}")
+            logger.error("Error during YouTube search: %s", e)
+            return None
 
+        self._search_cache_set(cache_key, "")
         return None
 
     def search_youtube_for_extras(
@@ -949,7 +1502,7 @@ class Downloader:
         title: str,
         verbose: bool = False,
         year: int | None = None,
-        exclude_ids: set[str] | None = None,
+        exclude_ids: Iterable[str] | None = None,
     ) -> dict | None:
         """
         Generic search for extras content on YouTube (movies or series)
@@ -965,28 +1518,43 @@ class Downloader:
         Returns:
             Video info dict or None if no suitable video found
         """
-        if exclude_ids is None:
-            exclude_ids = set()
+        # Freeze once: O(1) lookups and a stable snapshot for the cache key
+        exclude_ids = frozenset(exclude_ids or ())
+
+        cache_key = SearchCache.make_key(
+            "extras",
+            self.youtube_search_results,
+            query,
+            title,
+            year,
+            sorted(exclude_ids),
+        )
+        cached = self._search_cache_get(cache_key)
+        if cached is not None:
+            # An empty string is a cached miss (see SearchCache)
+            return json.loads(cached) if cached else None
 
         ydl_opts = {
-            "quiet": True,
-            "no_warnings": True,
-            "extract_flat": True,
+            **self._base_ydl_opts,
+            "extract_flat": "in_playlist",  # Get metadata for each video
             "default_search": f"ytsearch{self.youtube_search_results}",
-            "sleep_requests": 1,
         }
 
         if verbose:
-            logger.info(f"[VERBOSE] YouTube search query: '{query}'")
+            logger.info("[VERBOSE] YouTube search query: '%s'", query)
 
         title_lower = title.lower()
+        validation_failed = False
+        # Year strings are invariant across candidates: build them only once
+        year_strs = (str(year), str(year - 1), str(year + 1)) if year else None
 
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            with self.get_ydl(ydl_opts) as ydl:
                 search_url = f"ytsearch{self.youtube_search_results}:{query}"
                 if verbose:
-                    logger.info(f"[VERBOSE] Full search URL: {search_url}")
+                    logger.info("[VERBOSE] Full search URL: %s", search_url)
 
+                self.rate_limiter.acquire()
                 result = ydl.extract_info(search_url, download=False)
 
                 if result and "entries" in result and result["entries"]:
@@ -996,116 +1564,59 @@ class Downloader:
                         if not video or not video.get("id"):
                             continue
 
+                        # Cheapest filter first: most search hits don't
+                        # mention the movie/series title at all, skip them
+                        # before any other work
+                        video_title = (video.get("title") or "").lower()
+                        if title_lower not in video_title:
+                            continue
+
                         video_id = video.get("id")
                         # Skip videos already downloaded in this session
                         if video_id in exclude_ids:
                             if verbose:
                                 logger.info(
-                                    f"[VERBOSE] Skipping already downloaded: {video.get('title')}"
+                                    "[VERBOSE] Skipping already downloaded: %s",
+                                    video.get("title"),
                                 )
                             continue
 
-                        video_title = video.get("title", "").lower()
-                        score = 0
-
-                        # Must contain movie/series title
-                        if title_lower in video_title:
-                            score += 50
-                        else:
-                            # Skip videos that don't mention the title at all
-                            continue
+                        # Must contain movie/series title (checked above)
+                        score = 50
 
                         # Bonus if video mentions the year (for movies)
-                        if year:
-                            if str(year) in video_title:
+                        if year_strs:
+                            if year_strs[0] in video_title:
                                 score += 40
                             # Also check for adjacent years (sometimes listed differently)
                             elif (
-                                str(year - 1) in video_title
-                                or str(year + 1) in video_title
+                                year_strs[1] in video_title
+                                or year_strs[2] in video_title
                             ):
                                 score += 20
 
                         # Penalty if video contains other movie/show names
                         # (indicates it's for a different production)
-                        other_titles_keywords = [
-                            "rapunzel",
-                            "tangled",
-                            "white collar",
-                            "the wanted",
-                            "most wanted",
-                            "america's most wanted",
-                            "wanted man",
-                        ]
-                        for other_title in other_titles_keywords:
+                        for other_title in _OTHER_TITLES_KEYWORDS:
                             if other_title in video_title:
                                 score -= 100  # Heavy penalty
 
                         # Bonus for extras-related keywords
-                        extras_keywords = [
-                            "behind the scenes",
-                            "making of",
-                            "featurette",
-                            "interview",
-                            "deleted",
-                            "bloopers",
-                            "bts",
-                            "on set",
-                            "alternate",
-                            "gag reel",
-                            "vfx",
-                            "special effect",
-                            "visual effect",
-                        ]
-                        for keyword in extras_keywords:
-                            if keyword in video_title:
-                                score += 30
-                                break
+                        if any(kw in video_title for kw in _EXTRAS_KEYWORDS):
+                            score += 30
 
                         # Penalty for unrelated content
-                        penalty_keywords = [
-                            "gameplay",
-                            "walkthrough",
-                            "reaction",
-                            "review",
-                            "trailer",
-                            "teaser",
-                            "music video",
-                            "official video",
-                            "lyric",
-                            "movie clip",
-                            "scene",
-                            "all action",
-                            "then and now",
-                            "cast then",
-                            "best scenes",
-                            "full movie",
-                            "movie mistakes",
-                            "where to watch",
-                            "how to watch",
-                            "explained",
-                            "breakdown",
-                            "rampage",
-                            "analysis",
-                            "the guns of",
-                            "the art of",
-                            "(action)",
-                            "(horror)",
-                            "(comedy)",
-                            "(drama)",
-                            "full hd",
-                            "1080p",
-                            "4k uhd",
-                        ]
-                        for keyword in penalty_keywords:
+                        for keyword in _PENALTY_KEYWORDS:
                             if keyword in video_title:
                                 score -= 40
 
                         if score > 0:
                             candidates.append((score, video))
-                            if verbose:
+                            if verbose and logger.isEnabledFor(logging.INFO):
                                 logger.info(
-                                    f"[VERBOSE] Candidate: {video.get('title')} (score: {score})"
+                                    "[VERBOSE] Candidate: %s (score: %d)",
+                                    video.get("title"),
+                                    score,
                                 )
 
                     # Sort by score (highest first)
@@ -1118,50 +1629,51 @@ class Downloader:
 
                         # Validate video is accessible
                         try:
-                            validate_opts = {
-                                "quiet": True,
-                                "no_warnings": True,
-                                "skip_download": True,
-                            }
-                            with yt_dlp.YoutubeDL(validate_opts) as validate_ydl:
-                                video_info = validate_ydl.extract_info(
-                                    video_url, download=False
+                            video_info = self._get_info(video_url)
+                            if video_info:
+                                result_info = {
+                                    "id": video_id,
+                                    "url": video_url,
+                                    "webpage_url": video_url,
+                                    "title": video_info.get("title", "Unknown"),
+                                    "channel": video_info.get("channel", "Unknown"),
+                                    "uploader": video_info.get(
+                                        "uploader",
+                                        video_info.get("channel", "Unknown"),
+                                    ),
+                                    "description": video_info.get("description", ""),
+                                    "duration": video_info.get("duration", 0),
+                                    "view_count": video_info.get("view_count", 0),
+                                }
+
+                                if verbose:
+                                    logger.info(
+                                        "[VERBOSE] Valid video found: %s (score: %s)",
+                                        result_info["title"],
+                                        score,
+                                    )
+                                    logger.info("[VERBOSE] Video URL: %s", video_url)
+
+                                self._search_cache_set(
+                                    cache_key, json.dumps(result_info)
                                 )
-                                if video_info:
-                                    result_info = {
-                                        "id": video_id,
-                                        "url": video_url,
-                                        "webpage_url": video_url,
-                                        "title": video_info.get("title", "Unknown"),
-                                        "channel": video_info.get("channel", "Unknown"),
-                                        "uploader": video_info.get(
-                                            "uploader",
-                                            video_info.get("channel", "Unknown"),
-                                        ),
-                                        "description": video_info.get(
-                                            "description", ""
-                                        ),
-                                        "duration": video_info.get("duration", 0),
-                                        "view_count": video_info.get("view_count", 0),
-                                    }
-
-                                    if verbose:
-                                        logger.info(
-                                            f"[VERBOSE] Valid video found: {result_info['title']} (score: {score})"
-                                        )
-                                        logger.info(f"[VERBOSE] Video URL: {video_url}")
-
-                                    return result_info
+                                return result_info
                         except Exception as e:
+                            validation_failed = True
                             if verbose:
                                 logger.info(
-                                    f"[VERBOSE] Video {video_id} not accessible: {e}"
+                                    "[VERBOSE] Video %s not accessible: %s", video_id, e
                                 )
                             continue
 
         except Exception as e:
-            logger.error(f"Error during YouTube search: {e}")
+            logger.error("Error during YouTube search: %s", e)
+            return None
 
+        # A candidate that could not be validated (network error, rate
+        # limit) may well exist: don't record the search as a miss
+        if not validation_failed:
+            self._search_cache_set(cache_key, "")
         return None
 
     def create_strm_file_for_episode(
@@ -1171,6 +1683,7 @@ class Downloader:
         output_directory: Path,
         youtube_url: str,
         dry_run: bool = False,
+        subtitle_jobs: list[tuple[str, Path, str, dict | None]] | None = None,
     ) -> Tuple[bool, str | None, str | None, dict | None]:
         """
         Create a STRM file pointing to direct video stream URL and download subtitles
@@ -1181,6 +1694,8 @@ class Downloader:
             output_directory: Directory to save the STRM file
             youtube_url: YouTube URL to extract stream from
             dry_run: If True, simulate without creating files
+            subtitle_jobs: If given, the subtitle download is appended to this
+                list (see download_subtitles_bulk) instead of run right away
 
         Returns:
             Tuple (success, file_path, error_message, video_info)
@@ -1189,38 +1704,48 @@ class Downloader:
             base_filename = self.build_jellyfin_filename(series, episode)
             strm_file = output_directory / f"{base_filename}.strm"
 
-            # Extract direct stream URL from YouTube
-            ydl_opts = {
-                "format": self.format_string,
-                "quiet": True,
-                "no_warnings": True,
-                "sleep_requests": 1,  # Sleep 1 second between requests to avoid 429 errors
-            }
+            # Extract direct stream URL from YouTube. A STRM file holds a
+            # single URL, so ask for a single-file format: resolving a
+            # separate video+audio pair would be wasted work, and the
+            # video-only half would play without sound
+            ydl_opts = {**self._base_ydl_opts, "format": _STRM_FORMAT}
 
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            with self.get_ydl(ydl_opts) as ydl:
+                self.rate_limiter.acquire()
                 info = ydl.extract_info(youtube_url, download=False)
 
-                # Get the direct URL of the selected format
-                if "url" in info:
-                    stream_url = info["url"]
-                elif "formats" in info and info["formats"]:
-                    # Get the best format URL
-                    stream_url = info["formats"][-1]["url"]
-                else:
+                # Get the direct URL of the selected format. extract_info has
+                # already run format selection and merged a single-file pick
+                # into info; a merged video+audio pick only sets
+                # requested_formats, whose first entry is the video stream
+                stream_url = info.get("url") or (
+                    (info.get("requested_formats") or [{}])[0].get("url")
+                )
+                if not stream_url:
                     return False, None, "Could not extract stream URL", None
 
+            # Kept whole (formats, subtitle tracks) for the subtitle download
+            full_info = info
+            info = self._prune_info(info)
+
             if dry_run:
                 logger.info(f"DRY RUN: Would create STRM file: {strm_file}")
                 return True, str(strm_file), None, info
 
-            # Write direct stream URL to STRM file
-            with open(strm_file, "w", encoding="utf-8") as f:
-                f.write(stream_url)
+            # Write direct stream URL to STRM file (atomically, so Jellyfin's
+            # file watcher never reads a partial file)
+            STRMWriter.write_atomic(strm_file, stream_url)
 
             logger.info(f"STRM file created: {strm_file}")
 
-            # Download subtitles separately (they will be placed next to the STRM file)
-            self._download_subtitles_only(youtube_url, output_directory, base_filename)
+            # Download subtitles separately (they will be placed next to the
+            # STRM file), now or with the rest of the batch
+            subtitle_job = (youtube_url, output_directory, base_filename, full_info)
+            if subtitle_jobs is not None:
+                subtitle_jobs.append(subtitle_job)
+            else:
+                self.download_subtitles_bulk([subtitle_job])
+            self._forget_directory(output_directory)
 
             return True, str(strm_file), None, info
 
@@ -1229,49 +1754,56 @@ class Downloader:
             logger.error(error_msg)
             return False, None, error_msg, None
 
-    def _download_subtitles_only(
-        self, youtube_url: str, output_directory: Path, base_filename: str
-    ):
+    def download_subtitles_bulk(
+        self, jobs: list[tuple[str, Path, str, dict | None]]
+    ) -> None:
         """
-        Download only subtitles for a YouTube video
+        Download only subtitles for several YouTube videos in one session
+
+        A single YoutubeDL instance (and its connection pool) is reused for
+        every job; only the output template is switched between videos.
 
         Args:
-            youtube_url: YouTube video URL
-            output_directory: Directory to save subtitles
-            base_filename: Base filename (without extension)
+            jobs: List of (youtube_url, output_directory, base_filename, info);
+                info is the full extract_info() result when already fetched
+                (the video is then processed without being extracted again)
         """
-        try:
-            output_template = str(output_directory / f"{base_filename}.%(ext)s")
-
-            ydl_opts = {
-                "skip_download": True,  # Don't download the video
-                "writesubtitles": True,
-                "writeautomaticsub": True,
-                "subtitleslangs": self.subtitle_languages,
-                "allsubtitles": self.download_all_subtitles,
-                "subtitlesformat": "srt",
-                "outtmpl": output_template,
-                "quiet": True,
-                "no_warnings": True,
-                "ignoreerrors": True,
-                "sleep_requests": 1,  # Sleep 1 second between requests to avoid 429 errors
-                "sleep_subtitles": 3,  # Sleep 3 seconds before downloading subtitles
-                "postprocessors": [
-                    {
-                        "key": "FFmpegSubtitlesConvertor",
-                        "format": "srt",
-                    },
-                ],
-            }
-
-            logger.info(f"Downloading subtitles for: {youtube_url}")
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                ydl.extract_info(youtube_url, download=True)
+        if not jobs:
+            return
 
-            logger.info("Subtitles downloaded successfully")
+        ydl_opts = {
+            **self._base_ydl_opts,
+            "skip_download": True,  # Don't download the video
+            "writesubtitles": True,
+            "writeautomaticsub": True,
+            "subtitleslangs": self.subtitle_languages,
+            "allsubtitles": self.download_all_subtitles,
+            "subtitlesformat": "srt",
+            "outtmpl": {"default": "%(id)s.%(ext)s"},
+            "ignoreerrors": True,
+            "sleep_subtitles": 3,  # Sleep 3 seconds before downloading subtitles
+            "postprocessors": _SRT_PP,
+        }
 
+        try:
+            with self.get_ydl(ydl_opts) as ydl:
+                for youtube_url, output_directory, base_filename, info in jobs:
+                    try:
+                        ydl.params["outtmpl"]["default"] = str(
+                            output_directory / f"{base_filename}.%(ext)s"
+                        )
+                        logger.info(f"Downloading subtitles for: {youtube_url}")
+                        self.rate_limiter.acquire()
+                        if info:
+                            # process_ie_result mutates the dict it is given
+                            ydl.process_ie_result(copy.deepcopy(info), download=True)
+                        else:
+                            ydl.extract_info(youtube_url, download=True)
+                        logger.info("Subtitles downloaded successfully")
+                    except Exception as e:
+                        # Don't fail the whole operation if subtitles fail
+                        logger.warning(f"Could not download subtitles: {e}")
         except Exception as e:
-            # Don't fail the whole operation if subtitles fail
             logger.warning(f"Could not download subtitles: {e}")
 
     def download_episode(
@@ -1282,6 +1814,7 @@ class Downloader:
         force: bool = False,
         youtube_url: str | None = None,
         dry_run: bool = False,
+        subtitle_jobs: list[tuple[str, Path, str, dict | None]] | None = None,
     ) -> Tuple[bool, str | None, str | None, dict | None]:
         """
         Download an episode from YouTube
@@ -1293,6 +1826,7 @@ class Downloader:
             force: If True, re-download even if file exists
             youtube_url: Optional YouTube URL (will search if not provided)
             dry_run: If True, simulate without downloading or deleting files
+            subtitle_jobs: STRM mode only, see create_strm_file_for_episode()
 
         Returns:
             Tuple (success, file_path, error_message, video_info)
@@ -1300,39 +1834,23 @@ class Downloader:
         # Build filename
         base_filename = self.build_jellyfin_filename(series, episode)
 
-        # Check if file already exists
-        existing_files = list(output_directory.glob(f"{base_filename}.*"))
-
-        # If dry-run and files exist without force, return early
-        if dry_run and existing_files and not force:
-            logger.info(f"DRY RUN: File already exists: {existing_files[0].name}")
-            return True, str(existing_files[0]), None, None
-
-        # If not force mode and files exist, just return (file already present)
-        if existing_files and not force and not dry_run:
-            logger.info(f"File already exists: {existing_files[0].name}")
-            return True, str(existing_files[0]), None, None
-
-        # Force mode: delete existing files to allow switching between modes
-        if existing_files and force:
-            for existing_file in existing_files:
-                try:
-                    # Don't delete .srt files if we're in STRM mode (we'll regenerate them)
-                    if existing_file.suffix == ".srt" and self.use_strm_files:
-                        continue
-                    # Don't delete .srt files if we're downloading (yt-dlp will handle them)
-                    if existing_file.suffix == ".srt" and not self.use_strm_files:
-                        continue
-
-                    if dry_run:
-                        logger.info(
-                            f"DRY RUN: Would delete existing file: {existing_file.name}"
-                        )
-                    else:
-                        logger.info(f"Deleting existing file: {existing_file.name}")
-                        existing_file.unlink()
-                except Exception as e:
-                    logger.warning(f"Could not delete {existing_file.name}: {e}")
+        if not force:
+            # Only the first match matters: stop at the first hit
+            first_match = next(
+                self._iter_existing_files(output_directory, base_filename), None
+            )
+            if first_match:
+                # Files exist without force: return early (file already present)
+                if dry_run:
+                    logger.info(f"DRY RUN: File already exists: {first_match.name}")
+                else:
+                    logger.info(f"File already exists: {first_match.name}")
+                return True, str(first_match), None, None
+        else:
+            # Force mode: delete existing files to allow switching between modes
+            existing_files = self.find_existing_files(output_directory, base_filename)
+            if existing_files:
+                self._delete_existing_files(existing_files, output_directory, dry_run)
 
         # Search on YouTube if URL is not provided
         if not youtube_url:
@@ -1347,12 +1865,8 @@ class Downloader:
             logger.info(f"DRY RUN: Would download from {youtube_url}")
             try:
                 # Extract video info for NFO file creation
-                ydl_opts_info = {
-                    "quiet": True,
-                    "no_warnings": True,
-                }
-                with yt_dlp.YoutubeDL(ydl_opts_info) as ydl:
-                    video_info = ydl.extract_info(youtube_url, download=False)
+                info = self._get_info(youtube_url)
+                video_info = self._prune_info(info) if info else None
 
                 output_template = f"{base_filename}.mp4"
                 return True, str(output_directory / output_template), None, video_info
@@ -1364,7 +1878,12 @@ class Downloader:
         # If STRM mode is enabled, create STRM file instead of downloading
         if self.use_strm_files:
             return self.create_strm_file_for_episode(
-                series, episode, output_directory, youtube_url, dry_run=dry_run
+                series,
+                episode,
+                output_directory,
+                youtube_url,
+                dry_run=dry_run,
+                subtitle_jobs=subtitle_jobs,
             )
 
         # yt-dlp options
@@ -1377,7 +1896,6 @@ class Downloader:
             "no_warnings": False,
             # Sleep options to avoid 429 errors (Too Many Requests)
             "sleep_interval": 2,  # Sleep 2 seconds between downloads
-            "sleep_requests": 1,  # Sleep 1 second between requests
             "sleep_subtitles": 3,  # Sleep 3 seconds before downloading subtitles
             # Subtitle options - improved
             "writesubtitles": True,  # Download manual subtitles
@@ -1412,28 +1930,39 @@ class Downloader:
         max_retries = 5
         base_delay = 2  # Base delay in seconds
         last_error = None
+        delay = 0.0
 
         for attempt in range(max_retries):
             try:
                 print(
                     f"[Download] Attempt {attempt + 1}/{max_retries} for: {youtube_url}"
                 )
-                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                with self.get_ydl(ydl_opts) as ydl:
+                    self.rate_limiter.acquire()
                     info = ydl.extract_info(youtube_url, download=True)
 
                     # Find downloaded file
                     ext = info.get("ext", "mp4")
-                    final_file = output_directory / f"{base_filename}.{ext}"
+                    final_file = str(output_directory / f"{base_filename}.{ext}")
+
+                    # One stat serves both the existence check and the size
+                    try:
+                        file_size = os.stat(final_file).st_size
+                    except OSError:
+                        file_size = None
 
-                    if final_file.exists():
+                    if file_size is not None:
                         if self.verbose:
                             logger.info(f"[VERBOSE] Download successful: {final_file}")
                             logger.info(
-                                f"[VERBOSE] File size: {final_file.stat().st_size / (1024 * 1024):.2f} MB"
+                                f"[VERBOSE] File size: {file_size / (1024 * 1024):.2f} MB"
                             )
                         else:
                             logger.info(f"Download successful: {final_file}")
-                        return True, str(final_file), None, info
+                        # Don't rely on mtime alone: coarse timestamps (SMB,
+                        # FAT) may not change within the same second
+                        self._forget_directory(output_directory)
+                        return True, final_file, None, self._prune_info(info)
                     else:
                         error_msg = "Downloaded file not found"
                         logger.error(error_msg)
@@ -1451,15 +1980,13 @@ class Downloader:
                     or "too many" in error_str
                 ):
                     if attempt < max_retries - 1:  # Not the last attempt
-                        # Exponential backoff: 2s, 4s, 8s, 16s, 32s
-                        import time
-
-                        delay = base_delay * (2**attempt)
+                        # Jittered exponential backoff (decorrelated between workers)
+                        delay = decorrelated_jitter(delay, base_delay)
                         print(
-                            f"[Download] Rate limit error, retrying in {delay}s... (attempt {attempt + 2}/{max_retries})"
+                            f"[Download] Rate limit error, retrying in {delay:.1f}s... (attempt {attempt + 2}/{max_retries})"
                         )
                         logger.warning(
-                            f"Rate limit error, retrying in {delay}s... (attempt {attempt + 1}/{max_retries})"
+                            f"Rate limit error, retrying in {delay:.1f}s... (attempt {attempt + 1}/{max_retries})"
                         )
                         time.sleep(delay)
                         continue
@@ -1478,6 +2005,110 @@ class Downloader:
         logger.error(error_msg)
         return False, None, error_msg, None
 
+    def download_episodes(
+        self,
+        jobs: list[tuple[Series, Episode, Path]],
+        force: bool = False,
+        dry_run: bool = False,
+    ) -> Iterator[
+        tuple[Series, Episode, tuple[bool, str | None, str | None, dict | None]]
+    ]:
+        """
+        Download a batch of episodes, yielding each result as it completes
+
+        Searches run parallel_searches at a time and each resolved URL is handed
+        straight to the download pool (parallel_downloads at a time), so
+        downloads start while the remaining searches are still running. All
+        workers share the same YouTube rate limiter and pooled YoutubeDL
+        instances. In STRM mode the subtitles of every created STRM file are
+        then fetched together in one download_subtitles_bulk() session, once
+        the last result has been consumed.
+
+        Args:
+            jobs: (series, episode, output_directory) tuples
+            force: If True, re-download even if files exist
+            dry_run: If True, simulate without downloading or deleting files
+
+        Yields:
+            (series, episode, result) where result is the download_episode()
+            tuple (success, file_path, error_message, video_info)
+        """
+        search_pool = ThreadPoolExecutor(max_workers=self.parallel_searches)
+        download_pool = ThreadPoolExecutor(max_workers=self.parallel_downloads)
+        finished = False
+        # STRM subtitle downloads, batched until every STRM file is written
+        subtitle_jobs: list[tuple[str, Path, str, dict | None]] = []
+        try:
+            searches: dict[Future, tuple[Series, Episode, Path]] = {}
+            downloads: dict[Future, tuple[Series, Episode]] = {}
+
+            for series, episode, output_directory in jobs:
+                if not force:
+                    base_filename = self.build_jellyfin_filename(series, episode)
+                    if next(
+                        self._iter_existing_files(output_directory, base_filename),
+                        None,
+                    ):
+                        # download_episode reports the existing file, no search
+                        yield (
+                            series,
+                            episode,
+                            self.download_episode(
+                                series, episode, output_directory, dry_run=dry_run
+                            ),
+                        )
+                        continue
+
+                search = search_pool.submit(self.search_youtube, series, episode)
+                searches[search] = (series, episode, output_directory)
+
+            while searches or downloads:
+                done, _ = wait([*searches, *downloads], return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future in searches:
+                        series, episode, output_directory = searches.pop(future)
+                        try:
+                            youtube_url = future.result()
+                        except Exception as e:
+                            logger.error(f"Search error: {e}")
+                            youtube_url = None
+                        if not youtube_url:
+                            error_msg = "No video found on YouTube"
+                            logger.warning(error_msg)
+                            yield series, episode, (False, None, error_msg, None)
+                            continue
+                        download = download_pool.submit(
+                            self.download_episode,
+                            series,
+                            episode,
+                            output_directory,
+                            force=force,
+                            youtube_url=youtube_url,
+                            dry_run=dry_run,
+                            subtitle_jobs=subtitle_jobs,
+                        )
+                        downloads[download] = (series, episode)
+                    else:
+                        series, episode = downloads.pop(future)
+                        try:
+                            result = future.result()
+                        except Exception as e:
+                            logger.error(f"Download error: {e}")
+                            result = (False, None, f"Download error: {e}", None)
+                        yield series, episode, result
+            finished = True
+        finally:
+            # Closed early (consumer stopped, Ctrl-C): drop the searches and
+            # downloads still queued instead of waiting for all of them;
+            # only the ones already running finish
+            search_pool.shutdown(wait=finished, cancel_futures=not finished)
+            download_pool.shutdown(wait=finished, cancel_futures=not finished)
+
+        if subtitle_jobs:
+            self.download_subtitles_bulk(subtitle_jobs)
+            for directory in {job[1] for job in subtitle_jobs}:
+                self._forget_directory(directory)
+
     def download_video_from_url(
         self,
         youtube_url: str,
@@ -1500,11 +2131,10 @@ class Downloader:
             Tuple (success, file_path, error_message, video_info)
         """
         # Check if file already exists (exclude .part and .nfo files)
-        video_extensions = {".mp4", ".mkv", ".avi", ".mov", ".wmv", ".flv", ".webm"}
         existing_files = [
             f
-            for f in output_directory.glob(f"{base_filename}.*")
-            if f.suffix in video_extensions and not f.name.endswith(".part")
+            for f in self.find_existing_files(output_directory, base_filename)
+            if f.suffix in _VIDEO_EXTENSIONS and not f.name.endswith(".part")
         ]
 
         # If not force mode and valid files exist, just return
@@ -1514,30 +2144,14 @@ class Downloader:
 
         # Force mode: delete existing files
         if existing_files and force:
-            for existing_file in existing_files:
-                try:
-                    if existing_file.suffix == ".srt":
-                        continue
-                    if dry_run:
-                        logger.info(
-                            f"DRY RUN: Would delete existing file: {existing_file.name}"
-                        )
-                    else:
-                        logger.info(f"Deleting existing file: {existing_file.name}")
-                        existing_file.unlink()
-                except Exception as e:
-                    logger.warning(f"Could not delete {existing_file.name}: {e}")
+            self._delete_existing_files(existing_files, output_directory, dry_run)
 
         # If dry-run mode, extract video info but don't download
         if dry_run:
             logger.info(f"DRY RUN: Would download from {youtube_url}")
             try:
-                ydl_opts_info = {
-                    "quiet": True,
-                    "no_warnings": True,
-                }
-                with yt_dlp.YoutubeDL(ydl_opts_info) as ydl:
-                    video_info = ydl.extract_info(youtube_url, download=False)
+                info = self._get_info(youtube_url)
+                video_info = self._prune_info(info) if info else None
 
                 output_template = f"{base_filename}.mp4"
                 return True, str(output_directory / output_template), None, video_info
@@ -1555,7 +2169,6 @@ class Downloader:
             "quiet": False,
             "no_warnings": False,
             "sleep_interval": 2,
-            "sleep_requests": 1,
             "sleep_subtitles": 3,
             "writesubtitles": True,
             "writeautomaticsub": True,
@@ -1590,80 +2203,102 @@ class Downloader:
             logger.info(f"Downloading from: {youtube_url}")
 
         # First, get video info to check available subtitles (avoids 429 errors on unavailable languages)
-        try:
-            info_opts = {
-                "quiet": True,
-                "no_warnings": True,
-                "skip_download": True,
-            }
-            with yt_dlp.YoutubeDL(info_opts) as info_ydl:
-                video_info = info_ydl.extract_info(youtube_url, download=False)
-
-                # Get available subtitle languages
-                available_subs = set()
-                if video_info:
-                    if video_info.get("subtitles"):
-                        available_subs.update(video_info["subtitles"].keys())
-                    if video_info.get("automatic_captions"):
-                        available_subs.update(video_info["automatic_captions"].keys())
-
-                # Filter requested languages to only those available
-                if available_subs:
-                    requested_langs = set(self.subtitle_languages)
-                    available_requested = requested_langs.intersection(available_subs)
-
-                    if available_requested:
-                        # Only request exact matches to avoid 429 on unavailable languages
-                        ydl_opts["subtitleslangs"] = list(available_requested)
-                        if self.verbose:
-                            logger.info(
-                                f"[VERBOSE] Available subtitles: {', '.join(sorted(available_subs))}"
-                            )
-                            logger.info(
-                                f"[VERBOSE] Requesting only available: {', '.join(sorted(available_requested))}"
-                            )
-                    else:
-                        # No matching subtitles, disable subtitle download to avoid 429
-                        ydl_opts["writesubtitles"] = False
-                        ydl_opts["writeautomaticsub"] = False
-                        if self.verbose:
-                            logger.info(
-                                "[VERBOSE] No requested subtitles available, skipping subtitle download"
-                            )
-                else:
-                    # No subtitles at all
-                    ydl_opts["writesubtitles"] = False
-                    ydl_opts["writeautomaticsub"] = False
+        # The full info is kept so the first download attempt can reuse it.
+        # Languages found by a recent probe are reused without any request.
+        # Only worth it when a specific list of languages is requested
+        video_info = None
+        available_subs: set[str] | None = None
+        if not self.download_all_subtitles:
+            video_id = self._video_key(youtube_url)
+            available_subs = self._get_cached_subtitles(video_id)
+            if available_subs is None:
+                # Piggyback on an extraction already done during this run
+                # (extras validation, dry-run): no request, no pause
+                with self._info_cache_lock:
+                    memo = self._info_cache.get(video_id)
+                if memo is not None:
+                    available_subs = self._subtitle_langs_of(memo)
+                    self._set_cached_subtitles(video_id, available_subs)
+            if available_subs is None:
+                try:
+                    video_info = self._extract_info(youtube_url)
+
+                    # Get available subtitle languages
+                    available_subs = set()
+                    if video_info:
+                        available_subs = self._subtitle_langs_of(video_info)
+                        self._set_cached_subtitles(video_id, available_subs)
+                except Exception as e:
+                    # If we can't get info, continue with original settings
                     if self.verbose:
-                        logger.info("[VERBOSE] No subtitles available for this video")
-        except Exception as e:
-            # If we can't get info, continue with original settings
-            if self.verbose:
-                logger.warning(f"[VERBOSE] Could not pre-check subtitles: {e}")
+                        logger.warning(f"[VERBOSE] Could not pre-check subtitles: {e}")
+
+                # Small delay after subtitle check to avoid immediate rate limiting
+                time.sleep(2)
+            elif self.verbose:
+                logger.info("[VERBOSE] Using known subtitle availability")
 
-        # Small delay after subtitle check to avoid immediate rate limiting
-        import time
+        # Filter requested languages to only those available
+        if available_subs:
+            available_requested = self._subtitle_langs.intersection(available_subs)
 
-        time.sleep(2)
+            if available_requested:
+                # Only request exact matches to avoid 429 on unavailable languages
+                ydl_opts["subtitleslangs"] = list(available_requested)
+                if self.verbose:
+                    logger.info(
+                        f"[VERBOSE] Available subtitles: {', '.join(sorted(available_subs))}"
+                    )
+                    logger.info(
+                        f"[VERBOSE] Requesting only available: {', '.join(sorted(available_requested))}"
+                    )
+            else:
+                # No matching subtitles, disable subtitle download to avoid 429
+                ydl_opts["writesubtitles"] = False
+                ydl_opts["writeautomaticsub"] = False
+                if self.verbose:
+                    logger.info(
+                        "[VERBOSE] No requested subtitles available, skipping subtitle download"
+                    )
+        elif available_subs is not None:
+            # No subtitles at all
+            ydl_opts["writesubtitles"] = False
+            ydl_opts["writeautomaticsub"] = False
+            if self.verbose:
+                logger.info("[VERBOSE] No subtitles available for this video")
 
         # Retry logic with exponential backoff
         max_retries = 5
         base_delay = 2
         last_error = None
+        delay = 0.0
         tried_fallback_format = False
+        # Set when an attempt failed after yt-dlp may have written .part files,
+        # cleared once they are cleaned up: avoids rescanning the directory
+        parts_dirty = False
 
         for attempt in range(max_retries):
             try:
                 # Clean up .part files before retry to avoid corruption issues
                 if attempt > 0:
-                    self._cleanup_part_files(output_directory, base_filename)
+                    if parts_dirty:
+                        self._cleanup_part_files(output_directory, base_filename)
+                        parts_dirty = False
                     if self.verbose:
                         logger.info(
                             f"[VERBOSE] Retry attempt {attempt + 1}/{max_retries}"
                         )
 
-                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                    info = ydl.extract_info(youtube_url, download=True)
+                with self.get_ydl(ydl_opts) as ydl:
+                    if attempt == 0 and video_info:
+                        # Reuse the pre-check extraction: no second page fetch
+                        info = ydl.process_ie_result(
+                            copy.deepcopy(video_info), download=True
+                        )
+                    else:
+                        # Retries re-extract to get fresh stream URLs
+                        self.rate_limiter.acquire()
+                        info = ydl.extract_info(youtube_url, download=True)
 
                     # Check if download was actually successful
                     if not info:
@@ -1672,14 +2307,17 @@ class Downloader:
                         )
 
                     ext = info.get("ext", "mp4")
-                    final_file = output_directory / f"{base_filename}.{ext}"
+                    final_file = str(output_directory / f"{base_filename}.{ext}")
 
-                    if final_file.exists():
+                    if os.path.exists(final_file):
                         if self.verbose:
                             logger.info(f"[VERBOSE] Download successful: {final_file}")
                         else:
                             logger.info(f"Download successful: {final_file}")
-                        return True, str(final_file), None, info
+                        # Don't rely on mtime alone: coarse timestamps (SMB,
+                        # FAT) may not change within the same second
+                        self._forget_directory(output_directory)
+                        return True, final_file, None, self._prune_info(info)
                     else:
                         # File not found - might be a rate limit or download failure
                         # Check for common error indicators in the process
@@ -1690,6 +2328,7 @@ class Downloader:
             except Exception as e:
                 last_error = e
                 error_str = str(e).lower()
+                parts_dirty = True
 
                 if (
                     "403" in error_str
@@ -1699,11 +2338,10 @@ class Downloader:
                 ):
                     # Clean up .part files immediately after error
                     self._cleanup_part_files(output_directory, base_filename)
+                    parts_dirty = False
 
                     if attempt < max_retries - 1:
-                        import time
-
-                        delay = base_delay * (2**attempt)
+                        delay = decorrelated_jitter(delay, base_delay)
 
                         # After 2 failed attempts with 403, try a simpler format
                         if (
@@ -1718,7 +2356,7 @@ class Downloader:
                             )
                         else:
                             logger.warning(
-                                f"Rate limit error, retrying in {delay}s... (attempt {attempt + 1}/{max_retries})"
+                                f"Rate limit error, retrying in {delay:.1f}s... (attempt {attempt + 1}/{max_retries})"
                             )
 
                         time.sleep(delay)
@@ -1737,7 +2375,8 @@ class Downloader:
         error_msg = f"Download error: {last_error}"
         logger.error(error_msg)
         # Clean up any .part files left behind
-        self._cleanup_part_files(output_directory, base_filename)
+        if parts_dirty:
+            self._cleanup_part_files(output_directory, base_filename)
         return False, None, error_msg, None
 
     def get_episode_file_info(
@@ -1757,8 +2396,6 @@ class Downloader:
                 'subtitle_count': int
             }
         """
-        base_filename = self.build_jellyfin_filename(series, episode)
-
         # Create a pattern based on series and episode number only
         # Format: SeriesName - S00E##
         # This allows detection of files even if the episode title differs slightly
@@ -1767,25 +2404,14 @@ class Downloader:
         episode_pattern = (
             f"{series_name} - S{episode.season_number:02d}E{episode.episode_number:02d}"
         )
-
-        # Use pathlib to list all files in directory and filter manually
-        # This avoids glob pattern issues with special characters
-        try:
-            all_files = list(output_directory.iterdir())
-        except Exception:
-            all_files = []
-
-        # Filter files that match the episode pattern (SeriesName - S00E##)
-        # This is more tolerant than exact title matching and prevents re-downloading
-        # files that exist but have slightly different titles
-        existing_files = []
-        for f in all_files:
-            if not f.is_file():
-                continue
-            # Use the broader episode pattern for all file types
-            if f.name.startswith(episode_pattern):
-                existing_files.append(f)
-
+        # Same as build_jellyfin_filename(), reusing the sanitized series name
+        base_filename = f"{episode_pattern} - {self.sanitize_filename(episode.title)}"
+
+        # Filter the (cached) directory listing manually: this avoids glob
+        # pattern issues with special characters.
+        # Files matching the episode pattern (SeriesName - S00E##) are kept:
+        # this is more tolerant than exact title matching and prevents
+        # re-downloading files that exist but have slightly different titles
         info: dict = {
             "has_video": False,
             "has_strm": False,
@@ -1794,42 +2420,46 @@ class Downloader:
             "subtitles": {},
             "subtitle_count": 0,
         }
+        subtitles: defaultdict[str, list[str]] = defaultdict(list)
 
-        video_extensions = {".mp4", ".mkv", ".avi", ".mov", ".wmv", ".flv", ".webm"}
+        # Prefix of language-tagged subtitles, built once for every file
+        prefix_dot = base_filename + "."
+        prefix_len = len(prefix_dot)
 
-        for file in existing_files:
-            if file.suffix.lower() in video_extensions:
+        for entry in self._episode_entries(output_directory, episode_pattern):
+            # Use the broader episode pattern for all file types
+            name = entry.name
+            if not name.startswith(episode_pattern) or not entry.is_file():
+                continue
+
+            # Split the extension once from the name: no Path objects needed
+            dot = name.rfind(".")
+            stem, suffix = (name[:dot], name[dot:].lower()) if dot > 0 else (name, "")
+
+            if suffix in _VIDEO_EXTENSIONS:
                 info["has_video"] = True
-                info["video_file"] = file.name
-            elif file.suffix.lower() == ".strm":
+                info["video_file"] = name
+            elif suffix == ".strm":
                 info["has_strm"] = True
-                info["strm_file"] = file.name
-            elif file.suffix.lower() == ".srt":
+                info["strm_file"] = name
+            elif suffix == ".srt":
                 # Extract language code from filename
                 # Format: Series - S00E01 - Title.lang.srt or Series - S00E01 - Title.srt
-                # Remove base_filename to get the remaining part
-                # Handle both cases: with dot separator and without
-                if file.stem == base_filename:
-                    # Exact match, no language code: Series - S00E01 - Title.srt
+                if stem == base_filename:
+                    # Exact match, no language code
                     lang = "unknown"
-                elif file.stem.startswith(base_filename + "."):
-                    # With dot separator: Series - S00E01 - Title.lang.srt
-                    remaining = file.stem[len(base_filename) + 1 :]
-                    lang = remaining.split(".")[0] if remaining else "unknown"
+                elif stem.startswith(prefix_dot):
+                    # The language is the first tag after the title, so
+                    # "Title.fr.forced.srt" and "Title.en.sdh.srt" keep theirs
+                    lang = stem[prefix_len:].split(".", 1)[0] or "unknown"
                 else:
-                    # Fallback: try to extract from the end of filename
-                    # Could be Series - S00E01 - Title.lang.srt or similar variations
-                    parts = file.stem.split(".")
-                    if len(parts) > 1:
-                        # Last part before extension might be language code
-                        lang = parts[-1]
-                    else:
-                        lang = "unknown"
+                    # Title differs: look for a language-like tag at the end
+                    match = _SUBTITLE_LANG_RE.search(stem)
+                    lang = match.group(1) if match else "unknown"
 
-                subtitles_dict = info["subtitles"]
-                if lang not in subtitles_dict:
-                    subtitles_dict[lang] = []
-                subtitles_dict[lang].append(file.name)
-                info["subtitle_count"] = info["subtitle_count"] + 1
+                subtitles[lang].append(name)
 
+        # Plain dict for callers; the count is taken once at the end
+        info["subtitles"] = dict(subtitles)
+        info["subtitle_count"] = sum(map(len, subtitles.values()))
         return info
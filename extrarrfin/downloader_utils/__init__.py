@@ -2,12 +2,17 @@
 Downloader package - Modular video downloading components
 """
 
+from .cache import SearchCache
 from .nfo import NFOWriter
 from .paths import PathManager
+from .rate_limit import TokenBucket, decorrelated_jitter
 from .strm import STRMWriter
 
 __all__ = [
     "PathManager",
     "NFOWriter",
     "STRMWriter",
+    "SearchCache",
+    "TokenBucket",
+    "decorrelated_jitter",
 ]
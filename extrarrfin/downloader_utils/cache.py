@@ -0,0 +1,108 @@
+"""
+On-disk cache for YouTube search results
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+class SearchCache:
+    """SQLite-backed cache mapping a normalized search key to its result
+
+    Results are stored as text (a video URL or a JSON document). An empty
+    string is a valid cached value and records a search that found nothing,
+    so known misses are not searched again until the entry expires. Misses
+    expire sooner than hits (``negative_ttl``) so new uploads are found.
+    """
+
+    DEFAULT_TTL = 7 * 24 * 3600  # 7 days
+    DEFAULT_NEGATIVE_TTL = 24 * 3600  # 1 day
+
+    def __init__(
+        self,
+        db_path: Path,
+        ttl: int = DEFAULT_TTL,
+        negative_ttl: int = DEFAULT_NEGATIVE_TTL,
+    ):
+        """
+        Open (or create) the cache database
+
+        Args:
+            db_path: Path to the SQLite database file
+            ttl: Time-to-live of cached entries, in seconds
+            negative_ttl: Time-to-live of cached misses (empty results),
+                capped at ``ttl``
+        """
+        self.db_path = db_path
+        self.ttl = ttl
+        self.negative_ttl = min(ttl, negative_ttl)
+        self._lock = threading.Lock()
+
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        # WAL: concurrent runs (e.g. a manual run during schedule mode) read
+        # without blocking on each other's writes. Not available on every
+        # filesystem (network shares), where the default journal is kept
+        try:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        except sqlite3.Error as e:
+            logger.debug(f"Search cache stays in rollback journal mode: {e}")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache "
+            "(query TEXT PRIMARY KEY, k INT, result TEXT, ts INT)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(*parts: object) -> str:
+        """
+        Build a compact cache key from the parts identifying a search
+
+        Text parts are case- and whitespace-normalized (YouTube search and
+        the scorers ignore both), so a retitled "Behind  The Scenes" still
+        hits the entry cached for "behind the scenes".
+        """
+        raw = "|".join(
+            " ".join(part.split()).lower() if isinstance(part, str) else str(part)
+            for part in parts
+        )
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """Return the cached result for *key*, or None on miss/expiry"""
+        try:
+            with self._lock:
+                now = int(time.time())
+                row = self._conn.execute(
+                    "SELECT result FROM cache WHERE query = ? AND ts > ? "
+                    "AND (result != '' OR ts > ?)",
+                    (key, now - self.ttl, now - self.negative_ttl),
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Search cache read failed: {e}")
+            return None
+        return row[0] if row else None
+
+    def set(self, key: str, k: int, result: str) -> None:
+        """Store *result* for *key* (``k`` is the number of results searched)"""
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO cache (query, k, result, ts) "
+                    "VALUES (?, ?, ?, ?)",
+                    (key, k, result, int(time.time())),
+                )
+                self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Search cache write failed: {e}")
+
+    def close(self) -> None:
+        """Close the underlying database connection"""
+        with self._lock:
+            self._conn.close()
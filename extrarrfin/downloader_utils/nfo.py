@@ -3,27 +3,44 @@ NFO file creation for Jellyfin/Kodi compatibility
 """
 
 import logging
+import os
+import re
+import threading
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# YouTube video ID stored in the NFO <id> element
+_ID_PATTERN = re.compile(r"<id>([^<]+)</id>")
+# The <id> element comes right after the header, title and channel fields
+_NFO_HEAD_SIZE = 4096
+
+# Video ID found in each NFO file, keyed by path and validated by mtime, so
+# unchanged files are not read again on the next scan
+_nfo_id_cache: dict[str, tuple[int, str | None]] = {}
+_nfo_id_cache_lock = threading.Lock()
+
+# XML special characters and their entities (escaped in a single pass)
+_XML_ESCAPE = str.maketrans(
+    {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&apos;"}
+)
+
 
 class NFOWriter:
     """Creates NFO metadata files for media"""
 
+    @staticmethod
+    def clear_nfo_cache() -> None:
+        """Forget the video IDs remembered from scanned NFO files"""
+        with _nfo_id_cache_lock:
+            _nfo_id_cache.clear()
+
     @staticmethod
     def _escape_xml(text: str) -> str:
         """Escape special XML characters to prevent invalid NFO files"""
         if not text:
             return ""
-        return (
-            str(text)
-            .replace("&", "&amp;")
-            .replace("<", "&lt;")
-            .replace(">", "&gt;")
-            .replace('"', "&quot;")
-            .replace("'", "&apos;")
-        )
+        return str(text).translate(_XML_ESCAPE)
 
     @staticmethod
     def create_nfo_file(
@@ -55,20 +72,28 @@ class NFOWriter:
             video_info.get("webpage_url", video_info.get("url", ""))
         )
 
+        runtime_line = (
+            f"  <runtime>{video_info['duration'] // 60}</runtime>\n"
+            if video_info.get("duration")
+            else ""
+        )
+        # Built in full first so the file is written (and encoded) at once
+        content = (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            f"<{root_element}>\n"
+            f"  <title>{title}</title>\n"
+            f"  <originaltitle>{title}</originaltitle>\n"
+            f"  <studio>{channel}</studio>\n"
+            f"  <director>{uploader}</director>\n"
+            "  <source>YouTube</source>\n"
+            f"  <id>{video_id}</id>\n"
+            f"  <youtubeurl>{video_url}</youtubeurl>\n"
+            f"{runtime_line}"
+            f"</{root_element}>\n"
+        )
+
         try:
-            with open(nfo_path, "w", encoding="utf-8") as nfo:
-                nfo.write('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n')
-                nfo.write(f"<{root_element}>\n")
-                nfo.write(f"  <title>{title}</title>\n")
-                nfo.write(f"  <originaltitle>{title}</originaltitle>\n")
-                nfo.write(f"  <studio>{channel}</studio>\n")
-                nfo.write(f"  <director>{uploader}</director>\n")
-                nfo.write("  <source>YouTube</source>\n")
-                nfo.write(f"  <id>{video_id}</id>\n")
-                nfo.write(f"  <youtubeurl>{video_url}</youtubeurl>\n")
-                if video_info.get("duration"):
-                    nfo.write(f"  <runtime>{video_info['duration'] // 60}</runtime>\n")
-                nfo.write(f"</{root_element}>\n")
+            nfo_path.write_text(content, encoding="utf-8")
             logger.info(f"Created NFO file: {nfo_path}")
         except Exception as e:
             logger.warning(f"Failed to create NFO file: {e}")
@@ -86,22 +111,29 @@ class NFOWriter:
         """
         video_ids: set[str] = set()
 
-        if not directory.exists():
+        try:
+            with os.scandir(directory) as it:
+                # Suffix first: is_file() uses the cached d_type, no stat
+                nfo_entries = [e for e in it if e.name.endswith(".nfo") and e.is_file()]
+        except OSError:
             return video_ids
 
-        import re
-
-        id_pattern = re.compile(r"<id>([^<]+)</id>")
-
-        for nfo_file in directory.glob("*.nfo"):
+        for entry in nfo_entries:
             try:
-                content = nfo_file.read_text(encoding="utf-8")
-                match = id_pattern.search(content)
-                if match:
-                    video_id = match.group(1).strip()
-                    if video_id:
-                        video_ids.add(video_id)
+                mtime = entry.stat().st_mtime_ns
+                with _nfo_id_cache_lock:
+                    cached = _nfo_id_cache.get(entry.path)
+                if cached is not None and cached[0] == mtime:
+                    video_id = cached[1]
+                else:
+                    with open(entry.path, encoding="utf-8") as nfo:
+                        match = _ID_PATTERN.search(nfo.read(_NFO_HEAD_SIZE))
+                    video_id = match.group(1).strip() if match else None
+                    with _nfo_id_cache_lock:
+                        _nfo_id_cache[entry.path] = (mtime, video_id)
+                if video_id:
+                    video_ids.add(video_id)
             except Exception as e:
-                logger.warning(f"Failed to read NFO file {nfo_file}: {e}")
+                logger.warning(f"Failed to read NFO file {entry.path}: {e}")
 
         return video_ids
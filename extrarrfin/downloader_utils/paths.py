@@ -2,35 +2,67 @@
 Path management utilities for media files
 """
 
+import functools
 import re
 from pathlib import Path
 
 from ..models import Episode, Movie, Series
 
+# Characters not allowed in filenames (removed with str.translate, no regex)
+_INVALID_CHARS = str.maketrans("", "", '<>:"/\\|?*')
+_WHITESPACE_RE = re.compile(r"\s+")
+
 
 class PathManager:
     """Manages paths and filenames for media files"""
 
     @staticmethod
+    @functools.lru_cache(maxsize=512)
     def sanitize_filename(filename: str) -> str:
         """Clean a filename to make it compatible with filesystems"""
-        # Replace invalid characters
-        filename = re.sub(r'[<>:"/\\|?*]', "", filename)
+        # Memoized: the same series title is sanitized for every episode
+        # Remove invalid characters
+        filename = filename.translate(_INVALID_CHARS)
         # Replace multiple spaces
-        filename = re.sub(r"\s+", " ", filename)
+        filename = _WHITESPACE_RE.sub(" ", filename)
         return filename.strip()
 
+    @staticmethod
+    @functools.cache
+    def ensure_directory(directory: Path) -> Path:
+        """
+        Create a directory (and its parents) once per run
+
+        Memoized: the same Specials/extras folder is resolved for every
+        episode, so only the first call touches the filesystem. Call
+        ``PathManager.ensure_directory.cache_clear()`` between runs.
+        """
+        directory.mkdir(parents=True, exist_ok=True)
+        return directory
+
     @staticmethod
     def build_jellyfin_filename(series: Series, episode: Episode) -> str:
         """
         Build a Jellyfin-compatible filename
         Format: SeriesName - S00E## - EpisodeTitle.ext
         """
-        series_name = PathManager.sanitize_filename(series.title)
-        episode_title = PathManager.sanitize_filename(episode.title)
+        # Memoize on the fields the name uses: hashing a Series would also
+        # hash its seasons, and a small key is shared across equal titles
+        return PathManager._jellyfin_filename(
+            series.title, episode.season_number, episode.episode_number, episode.title
+        )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _jellyfin_filename(
+        series_title: str, season_number: int, episode_number: int, episode_title: str
+    ) -> str:
+        """Memoized body of build_jellyfin_filename()"""
+        series_name = PathManager.sanitize_filename(series_title)
+        episode_title = PathManager.sanitize_filename(episode_title)
 
         # Jellyfin format for specials
-        filename = f"{series_name} - S{episode.season_number:02d}E{episode.episode_number:02d} - {episode_title}"
+        filename = f"{series_name} - S{season_number:02d}E{episode_number:02d} - {episode_title}"
 
         return filename
 
@@ -58,10 +90,7 @@ class PathManager:
         )
 
         # Create Specials directory if it doesn't exist
-        specials_dir = real_path / "Specials"
-        specials_dir.mkdir(parents=True, exist_ok=True)
-
-        return specials_dir
+        return PathManager.ensure_directory(real_path / "Specials")
 
     @staticmethod
     def get_extras_directory(
@@ -77,10 +106,7 @@ class PathManager:
         )
 
         # Create extras directory if it doesn't exist
-        extras_dir = real_path / "extras"
-        extras_dir.mkdir(parents=True, exist_ok=True)
-
-        return extras_dir
+        return PathManager.ensure_directory(real_path / "extras")
 
     @staticmethod
     def get_movie_directory(
@@ -97,10 +123,7 @@ class PathManager:
         real_path = PathManager._map_path(movie.path, media_directory, radarr_directory)
 
         # Create extras directory inside movie directory
-        extras_dir = real_path / "extras"
-        extras_dir.mkdir(parents=True, exist_ok=True)
-
-        return extras_dir
+        return PathManager.ensure_directory(real_path / "extras")
 
     @staticmethod
     def get_movie_extras_directory(
@@ -144,12 +167,10 @@ class PathManager:
             arr_directory: Path as configured in *arr application
         """
         if media_directory and arr_directory:
-            source = Path(source_path)
-            try:
-                # Replace *arr root with real root
-                relative_path = source.relative_to(arr_directory)
-                return Path(media_directory) / relative_path
-            except ValueError:
-                # If path is not relative to arr_directory, use as-is
-                return Path(source_path)
+            # Replace *arr root with real root: plain string prefix check on a
+            # path component boundary, no Path parts splitting
+            arr_root = arr_directory.rstrip("/")
+            if source_path == arr_root or source_path.startswith(arr_root + "/"):
+                return Path(media_directory.rstrip("/") + source_path[len(arr_root) :])
+        # If path is not relative to arr_directory, use as-is
         return Path(source_path)
@@ -0,0 +1,64 @@
+"""
+Token-bucket rate limiting for YouTube requests
+"""
+
+import random
+import threading
+import time
+
+
+class TokenBucket:
+    """Thread-safe token bucket shared by every yt-dlp call
+
+    Up to ``capacity`` calls may happen back to back; after that, calls are
+    spaced so the long-run rate never exceeds ``refill_per_sec``.
+    """
+
+    def __init__(self, capacity: float = 10, refill_per_sec: float = 30 / 60):
+        """
+        Args:
+            capacity: Maximum number of tokens (burst size)
+            refill_per_sec: Tokens added per second (sustained rate)
+        """
+        self.capacity = capacity
+        self.refill_per_sec = refill_per_sec
+        self._tokens = float(capacity)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        """Add the tokens accumulated since the last call"""
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._last) * self.refill_per_sec
+        )
+        self._last = now
+
+    def acquire(self) -> None:
+        """Take one token, sleeping just long enough for one to be available"""
+        with self._lock:
+            self._refill()
+            self._tokens -= 1
+            deficit = -self._tokens
+        # Sleep outside the lock: the token is already reserved (the balance
+        # may go negative), so concurrent callers queue up behind us
+        if deficit > 0:
+            time.sleep(deficit / self.refill_per_sec)
+
+
+def decorrelated_jitter(prev_delay: float, base: float, cap: float = 60) -> float:
+    """
+    Next retry delay using "decorrelated jitter" backoff
+
+    Delays grow roughly exponentially but are randomized, so workers that
+    fail at the same moment don't all retry at the same moment again.
+
+    Args:
+        prev_delay: Previous delay in seconds (0 for the first retry)
+        base: Minimum delay in seconds
+        cap: Maximum delay in seconds
+
+    Returns:
+        Delay in seconds
+    """
+    return min(cap, random.uniform(base, max(base, prev_delay) * 3))
@@ -3,6 +3,7 @@ STRM file creation for streaming mode
 """
 
 import logging
+import os
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -11,6 +12,38 @@ logger = logging.getLogger(__name__)
 class STRMWriter:
     """Creates STRM files for streaming instead of downloading"""
 
+    @staticmethod
+    def write_bytes(path: Path, data: bytes) -> None:
+        """
+        Write a small file with a single unbuffered write
+
+        STRM files hold one URL: going straight to os.write skips the text
+        layer and buffered file object of open()/write_text().
+        """
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def write_atomic(path: Path, content: str) -> None:
+        """
+        Write *content* to *path* through a temporary sibling file
+
+        The final rename is atomic, so media server scanners never pick up
+        a partially written file.
+        """
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        try:
+            STRMWriter.write_bytes(tmp_path, content.encode("utf-8"))
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
     @staticmethod
     def create_strm_file(
         youtube_url: str,
@@ -31,8 +64,7 @@ class STRMWriter:
         strm_path = output_directory / f"{base_filename}.strm"
 
         try:
-            with open(strm_path, "w", encoding="utf-8") as f:
-                f.write(youtube_url)
+            STRMWriter.write_atomic(strm_path, youtube_url)
             logger.info(f"Created STRM file: {strm_path}")
             return strm_path
         except Exception as e:
@@ -5,6 +5,8 @@ Jellyfin API client for library refresh
 import logging
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +28,30 @@ class JellyfinClient:
             "X-Emby-Token": api_key,
             "Content-Type": "application/json",
         }
+        # Keep-alive session; transient gateway errors (e.g. Jellyfin behind
+        # a restarting reverse proxy) are retried with a short backoff
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[502, 503, 504],
+                allowed_methods=None,  # Also retry the refresh POST
+            )
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def close(self) -> None:
+        """Close the HTTP session"""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def refresh_library(self) -> bool:
         """
@@ -39,7 +65,7 @@ class JellyfinClient:
             endpoint = f"{self.url}/Library/Refresh"
 
             logger.info(f"Triggering Jellyfin library refresh at {self.url}")
-            response = requests.post(endpoint, headers=self.headers, timeout=10)
+            response = self.session.post(endpoint, timeout=10)
 
             if response.status_code == 204:
                 logger.info("Jellyfin library refresh triggered successfully")
@@ -63,7 +89,7 @@ class JellyfinClient:
         """
         try:
             endpoint = f"{self.url}/System/Info"
-            response = requests.get(endpoint, headers=self.headers, timeout=5)
+            response = self.session.get(endpoint, timeout=5)
 
             if response.status_code == 200:
                 data = response.json()
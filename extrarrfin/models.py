@@ -2,10 +2,10 @@
 Data models for ExtrarrFin
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Episode:
     """Represents an episode in Sonarr"""
 
@@ -20,16 +20,16 @@ class Episode:
     overview: str | None = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Season:
     """Represents a season in Sonarr"""
 
     season_number: int
     monitored: bool
-    statistics: dict
+    statistics: dict = field(hash=False)  # Not hashable, left out of the hash
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Series:
     """Represents a series in Sonarr"""
 
@@ -37,14 +37,14 @@ class Series:
     title: str
     path: str
     monitored: bool
-    seasons: list[Season]
+    seasons: tuple[Season, ...]
     year: int | None = None
     tvdb_id: int | None = None
     network: str | None = None
-    tags: list[int] | None = None  # List of tag IDs from Sonarr
+    tags: tuple[int, ...] | None = None  # Tag IDs from Sonarr
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Movie:
     """Represents a movie in Radarr"""
 
@@ -55,11 +55,11 @@ class Movie:
     year: int | None = None
     tmdb_id: int | None = None
     studio: str | None = None
-    tags: list[int] | None = None  # List of tag IDs from Radarr
+    tags: tuple[int, ...] | None = None  # Tag IDs from Radarr
     has_file: bool = False
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DownloadResult:
     """Download result"""
 
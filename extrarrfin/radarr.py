@@ -11,6 +11,21 @@ from .models import Movie
 logger = logging.getLogger(__name__)
 
 
+def _parse_movie(item: dict) -> Movie:
+    """Build a Movie from a Radarr API movie resource"""
+    return Movie(
+        id=item["id"],
+        title=item["title"],
+        path=item["path"],
+        monitored=item["monitored"],
+        year=item.get("year"),
+        tmdb_id=item.get("tmdbId"),
+        studio=item.get("studio"),
+        tags=tuple(item.get("tags") or ()),
+        has_file=item.get("hasFile", False),
+    )
+
+
 class RadarrClient(BaseArrClient[Movie]):
     """Client to interact with Radarr API"""
 
@@ -28,29 +43,25 @@ class RadarrClient(BaseArrClient[Movie]):
 
     def get_all_movies(self) -> list[Movie]:
         """Fetch all movies"""
-        data = self._get("movie")
-        movie_list = []
-
-        for item in data:
-            movie = Movie(
-                id=item["id"],
-                title=item["title"],
-                path=item["path"],
-                monitored=item["monitored"],
-                year=item.get("year"),
-                tmdb_id=item.get("tmdbId"),
-                studio=item.get("studio"),
-                tags=item.get("tags", []),
-                has_file=item.get("hasFile", False),
-            )
-            movie_list.append(movie)
-
-        return movie_list
+        return [_parse_movie(item) for item in self._get_cached("movie")]
 
     def get_monitored_movies(self) -> list[Movie]:
         """Fetch all monitored movies"""
-        all_movies = self.get_all_movies()
-        return [m for m in all_movies if m.monitored]
+        return [
+            _parse_movie(item)
+            for item in self._get_cached("movie")
+            if item["monitored"]
+        ]
+
+    def get_want_extras_movies(self) -> list[Movie]:
+        """Fetch monitored movies tagged want-extras
+
+        Items are filtered on the raw response, so only matching movies are
+        turned into models.
+        """
+        return [
+            _parse_movie(item) for item in self._monitored_with_want_extras("movie")
+        ]
 
     def rescan_movie(self, movie_id: int) -> Any:
         """Trigger a rescan for a specific movie"""
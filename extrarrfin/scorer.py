@@ -13,6 +13,139 @@ from .models import Series
 logger = logging.getLogger(__name__)
 
 
+def _marker_re(markers: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile *markers* into one pattern matching any of them as a substring
+
+    A single search scans the text once instead of once per marker.
+    """
+    return re.compile("|".join(map(re.escape, markers)))
+
+
+# Title/channel markers of official uploads
+_OFFICIAL_MARKERS = ("official", "vevo", "verified")
+# Description markers of official uploads (the series network also counts)
+_OFFICIAL_DESCRIPTION_MARKERS = ("official", "©", "all rights reserved")
+_COMPILATION_MARKERS = ("compilation", "playlist", "all episodes", "full series")
+_VIDEO_GAME_MARKERS = (
+    "juno new origins",
+    "juno",
+    "kerbal space program",
+    "ksp",
+    "gameplay",
+    "game play",
+    "let's play",
+    "walkthrough",
+    "gaming",
+    "simulator",
+    "sim",
+    "mod",
+    "modded",
+    "pc game",
+    "video game",
+)
+_OLD_YEAR_RE = re.compile(r"\(19\d{2}\)")
+
+# Behind-the-scenes scorer markers
+_BTS_MARKERS = (
+    "behind the scenes",
+    "behind the scene",
+    "bts",
+    "making of",
+    "making-of",
+    "backstage",
+    "featurette",
+)
+_BTS_CORE_MARKERS = ("behind the scenes", "behind the scene", "bts")
+_TRAILER_BTS_MARKERS = (
+    "behind the scenes",
+    "behind the scene",
+    "bts",
+    "making of",
+    "featurette",
+)
+_BREAKDOWN_MARKERS = ("vfx breakdown", "breakdown", "visual effects")
+_CHARACTER_MARKERS = (":", "with", "interview", "character")
+# Channels that specialize in behind-the-scenes content
+_KNOWN_BTS_CHANNELS = (
+    "filmisnow",
+    "rotten tomatoes",
+    "ign",
+    "entertainment weekly",
+    "collider",
+    "comicbook.com",
+    "screen rant",
+    "variety",
+    "the hollywood reporter",
+    "deadline",
+    "den of geek",
+    "syfy",
+    "nerdist",
+    "movie trailers source",
+    "joblo",
+)
+# Channel types that reuse a series title for unrelated content
+_UNRELATED_CHANNEL_MARKERS = (
+    "school",
+    "university",
+    "college",
+    "fashion brand",
+    "prada",
+    "museum",
+    "art gallery",
+    "foundation (charity)",
+    "sixth form",
+    "centre",
+)
+# Title markers of content that is not behind-the-scenes footage
+_BTS_PENALTY_MARKERS = (
+    "compilation",
+    "playlist",
+    "all episodes",
+    "full series",
+    "reaction",
+    "review",
+    "unboxing",
+    "gameplay",
+    "walkthrough",
+    "interview only",
+    "cast interview",
+    "ending explained",
+    "theories",
+)
+# Words ignored when comparing titles for duplicates
+_DEDUP_STOPWORDS = frozenset(("the", "and", "for", "with", "from"))
+
+_VIDEO_GAME_RE = _marker_re(_VIDEO_GAME_MARKERS)
+_KNOWN_BTS_CHANNEL_RE = _marker_re(_KNOWN_BTS_CHANNELS)
+_UNRELATED_CHANNEL_RE = _marker_re(_UNRELATED_CHANNEL_MARKERS)
+_BTS_PENALTY_RE = _marker_re(_BTS_PENALTY_MARKERS)
+
+
+def _lower_field(video: dict, field: str) -> str:
+    """Lowercased *field* of *video*, memoized on the dict
+
+    The same candidate dict goes through scoring and duplicate removal, so
+    each text field is lowercased only once.
+    """
+    key = f"_{field}_lower"
+    value = video.get(key)
+    if value is None:
+        value = video[key] = (video.get(field) or "").lower()
+    return value
+
+
+def _dedup_words(video: dict) -> set[str]:
+    """Significant title words used to spot duplicates, memoized on the dict"""
+    words = video.get("_dedup_words")
+    if words is None:
+        words = video["_dedup_words"] = {
+            word.strip(".,!?-—|:;()[]")
+            for word in _lower_field(video, "title").split()
+            if len(word) > 2 and word not in _DEDUP_STOPWORDS
+        }
+    return words
+
+
 @dataclass
 class ScoringWeights:
     """Configurable weights for video scoring"""
@@ -46,6 +179,34 @@ class ScoringWeights:
     )
     min_view_count_for_scoring: int = 50  # Penalty for very low view counts
 
+    def max_score(self, has_network: bool, has_year: bool) -> float:
+        """
+        Highest score a candidate can reach with these weights
+
+        Args:
+            has_network: Whether the series network can earn network_match
+            has_year: Whether the series year can earn the upload date bonus
+
+        Returns:
+            Sum of every bonus available (penalties left out)
+        """
+        score = (
+            self.exact_match
+            + self.episode_in_title
+            + self.series_in_title
+            + self.word_ratio_max
+            + self.title_length_max
+            + self.official_verified
+            + self.description_match_max
+            + self.view_count_max
+            + self.like_ratio_max
+        )
+        if has_network:
+            score += self.network_match
+        if has_year:
+            score += self.upload_date_proximity_max
+        return score
+
 
 class VideoScorer:
     """
@@ -91,14 +252,21 @@ class VideoScorer:
         if not videos:
             return None
 
-        scored_videos = []
+        # Best candidate so far, tracked while scoring
+        best: dict | None = None
+        best_score = float("-inf")
 
         # Normalize strings for comparison
         series_lower = series.title.lower()
         episode_lower = episode_title.lower()
-        search_words = set((series.title + " " + episode_title).lower().split())
+        search_words = set(series_lower.split())
+        search_words.update(episode_lower.split())
         network_lower = series.network.lower() if series.network else None
         series_year = series.year
+        # A candidate at this score cannot be beaten by the remaining ones
+        early_exit_score = self.weights.max_score(
+            bool(network_lower), bool(series_year)
+        )
 
         if self.verbose:
             if network_lower:
@@ -120,7 +288,8 @@ class VideoScorer:
             )
 
             video["_score"] = score
-            scored_videos.append(video)
+            if score > best_score:
+                best, best_score = video, score
 
             if self.verbose:
                 title = video.get("title", "")
@@ -128,7 +297,13 @@ class VideoScorer:
                     f"[VERBOSE] Candidate: {title[:60]}... (score: {score:.2f})"
                 )
 
-        return self._select_best_video(scored_videos)
+            # Unbeatable: the remaining candidates are not scored
+            if score >= early_exit_score:
+                if self.verbose:
+                    logger.info("[VERBOSE] Early exit: no candidate can score higher")
+                break
+
+        return self._select_best_video(best)
 
     def _score_video(
         self,
@@ -142,11 +317,10 @@ class VideoScorer:
         """Calculate score for a single video"""
 
         title = video.get("title", "")
-        title_lower = title.lower()
+        title_lower = _lower_field(video, "title")
         channel = video.get("channel", "")
-        channel_lower = channel.lower()
-        description = video.get("description", "") or ""
-        description_lower = description.lower()
+        channel_lower = _lower_field(video, "channel")
+        description_lower = _lower_field(video, "description")
         duration = video.get("duration")
         view_count = video.get("view_count")
         upload_date = video.get("upload_date")
@@ -194,11 +368,11 @@ class VideoScorer:
         if series_lower in title_lower:
             score += self.weights.series_in_title
 
-        # Word matching ratio
-        title_words = set(title_lower.split())
-        common_words = search_words & title_words
+        # Word matching ratio (intersection() takes the split list directly,
+        # no intermediate set of title words)
         if search_words:
-            word_ratio = len(common_words) / len(search_words)
+            common_count = len(search_words.intersection(title_lower.split()))
+            word_ratio = common_count / len(search_words)
             score += word_ratio * self.weights.word_ratio_max
 
         # Prefer shorter titles (less likely to be compilations)
@@ -207,7 +381,7 @@ class VideoScorer:
             score += self.weights.title_length_max * (1 - title_length / 100)
 
         # Official/verified indicators
-        if any(word in title_lower for word in ["official", "vevo", "verified"]):
+        if any(word in title_lower for word in _OFFICIAL_MARKERS):
             score += self.weights.official_verified
             if self.verbose:
                 logger.info("[VERBOSE] Official/verified bonus")
@@ -304,11 +478,9 @@ class VideoScorer:
             desc_bonus += 7
 
         # Official content indicators
-        official_indicators = ["official", "©", "all rights reserved"]
-        if network_lower:
-            official_indicators.append(network_lower)
-
-        if any(ind in description_lower for ind in official_indicators):
+        if any(ind in description_lower for ind in _OFFICIAL_DESCRIPTION_MARKERS) or (
+            network_lower and network_lower in description_lower
+        ):
             desc_bonus += 5
 
         if desc_bonus > 0:
@@ -369,31 +541,11 @@ class VideoScorer:
         penalty = 0.0
 
         # Compilation/playlist indicators
-        if any(
-            word in title_lower
-            for word in ["compilation", "playlist", "all episodes", "full series"]
-        ):
+        if any(word in title_lower for word in _COMPILATION_MARKERS):
             penalty += self.weights.compilation_penalty
 
         # Video game content
-        video_game_indicators = [
-            "juno new origins",
-            "juno",
-            "kerbal space program",
-            "ksp",
-            "gameplay",
-            "game play",
-            "let's play",
-            "walkthrough",
-            "gaming",
-            "simulator",
-            "sim",
-            "mod",
-            "modded",
-            "pc game",
-            "video game",
-        ]
-        if any(indicator in title_lower for indicator in video_game_indicators):
+        if _VIDEO_GAME_RE.search(title_lower):
             if self.verbose:
                 logger.info("[VERBOSE] Video game penalty")
             penalty += self.weights.video_game_penalty
@@ -406,8 +558,9 @@ class VideoScorer:
         """Penalty for year mismatches"""
         penalty = 0.0
 
-        # Old year in title (e.g., "(1978)")
-        old_year_match = re.search(r"\(19\d{2}\)", title)
+        # Old year in title (e.g., "(1978)"); the plain substring test skips
+        # the regex for the vast majority of titles
+        old_year_match = "(19" in title and _OLD_YEAR_RE.search(title)
         if old_year_match:
             if self.verbose:
                 logger.info(f"[VERBOSE] Old year penalty: {old_year_match.group()}")
@@ -436,10 +589,10 @@ class VideoScorer:
         self, title: str, title_lower: str, series_lower: str
     ) -> float:
         """Penalty if another title appears before series name"""
-        if series_lower not in title_lower:
+        series_position = title_lower.find(series_lower)
+        if series_position < 0:
             return 0.0
 
-        series_position = title_lower.find(series_lower)
         title_before_series = title_lower[:series_position].strip()
 
         if not title_before_series:
@@ -461,13 +614,12 @@ class VideoScorer:
 
         return 0.0
 
-    def _select_best_video(self, scored_videos: list) -> dict | None:
-        """Select the best video from scored list"""
-        if not scored_videos:
+    def _select_best_video(self, best: dict | None) -> dict | None:
+        """Accept the highest-scoring video if it reaches the minimum score"""
+        if best is None:
             return None
 
-        best = max(scored_videos, key=lambda v: v.get("_score", 0))
-        best_score = best.get("_score", 0)
+        best_score = best["_score"]
 
         # Check minimum score threshold
         if best_score < self.min_score:
@@ -521,27 +673,9 @@ class VideoScorer:
 
         scored_videos = []
 
-        # Known channels that specialize in BTS/behind-the-scenes content
-        known_bts_channels = [
-            "filmisnow",
-            "rotten tomatoes",
-            "ign",
-            "entertainment weekly",
-            "collider",
-            "comicbook.com",
-            "screen rant",
-            "variety",
-            "the hollywood reporter",
-            "deadline",
-            "den of geek",
-            "syfy",
-            "nerdist",
-            "movie trailers source",
-            "joblo",
-        ]
-
         # Normalize strings for comparison
         series_lower = series.title.lower()
+        series_words = set(series_lower.split())
         network_lower = series.network.lower() if series.network else None
 
         if self.verbose and network_lower:
@@ -552,31 +686,17 @@ class VideoScorer:
                 continue
 
             title = video.get("title", "")
-            title_lower = title.lower()
+            title_lower = _lower_field(video, "title")
             channel = video.get("channel", "")
-            channel_lower = channel.lower()
+            channel_lower = _lower_field(video, "channel")
             score: float = 0
 
             # Contains behind the scenes / bts / making of (essential for this mode)
-            if any(
-                phrase in title_lower
-                for phrase in [
-                    "behind the scenes",
-                    "behind the scene",
-                    "bts",
-                    "making of",
-                    "making-of",
-                    "backstage",
-                    "featurette",
-                ]
-            ):
+            if any(phrase in title_lower for phrase in _BTS_MARKERS):
                 score += 50
 
             # Bonus for VFX/technical breakdown content (interesting BTS content)
-            if any(
-                phrase in title_lower
-                for phrase in ["vfx breakdown", "breakdown", "visual effects"]
-            ):
+            if any(phrase in title_lower for phrase in _BREAKDOWN_MARKERS):
                 score += 40
                 if self.verbose:
                     logger.info("[VERBOSE] VFX/Breakdown bonus applied")
@@ -586,12 +706,8 @@ class VideoScorer:
                 score += 40
 
                 # Additional bonus for character/actor focused BTS content
-                if any(
-                    phrase in title_lower
-                    for phrase in [":", "with", "interview", "character"]
-                ) and any(
-                    bts in title_lower
-                    for bts in ["behind the scenes", "behind the scene", "bts"]
+                if any(phrase in title_lower for phrase in _CHARACTER_MARKERS) and any(
+                    bts in title_lower for bts in _BTS_CORE_MARKERS
                 ):
                     score += 15
                     if self.verbose:
@@ -621,28 +737,13 @@ class VideoScorer:
                         )
             else:
                 # Check if it's a known BTS content channel
-                if any(
-                    known_channel in channel_lower
-                    for known_channel in known_bts_channels
-                ):
+                if _KNOWN_BTS_CHANNEL_RE.search(channel_lower):
                     score += 40
                     if self.verbose:
                         logger.info(f"[VERBOSE] Known BTS channel bonus: {channel}")
                 # Penalize videos from unrelated channels
                 elif network_lower and channel and series_lower in title_lower:
-                    unrelated_keywords = [
-                        "school",
-                        "university",
-                        "college",
-                        "fashion brand",
-                        "prada",
-                        "museum",
-                        "art gallery",
-                        "foundation (charity)",
-                        "sixth form",
-                        "centre",
-                    ]
-                    if any(keyword in channel_lower for keyword in unrelated_keywords):
+                    if _UNRELATED_CHANNEL_RE.search(channel_lower):
                         score -= 50
                         if self.verbose:
                             logger.info(
@@ -660,18 +761,14 @@ class VideoScorer:
                     )
 
             # Word matching ratio
-            series_words = set(series.title.lower().split())
-            title_words = set(title_lower.split())
-            common_words = series_words & title_words
             if series_words:
-                word_ratio = len(common_words) / len(series_words)
+                common_count = len(series_words.intersection(title_lower.split()))
+                word_ratio = common_count / len(series_words)
                 score += word_ratio * 30
 
             # Check for official/quality indicators
             title_and_channel = (title + " " + channel).lower()
-            if any(
-                word in title_and_channel for word in ["official", "vevo", "verified"]
-            ):
+            if any(word in title_and_channel for word in _OFFICIAL_MARKERS):
                 score += 20
 
             # Prefer shorter titles (less likely to be compilations)
@@ -699,36 +796,12 @@ class VideoScorer:
                             )
 
             # Penalize certain patterns that indicate wrong content
-            penalty_patterns = [
-                "compilation",
-                "playlist",
-                "all episodes",
-                "full series",
-                "reaction",
-                "review",
-                "unboxing",
-                "gameplay",
-                "walkthrough",
-                "interview only",
-                "cast interview",
-                "ending explained",
-                "theories",
-            ]
-            if any(word in title_lower for word in penalty_patterns):
+            if _BTS_PENALTY_RE.search(title_lower):
                 score -= 30
 
             # Penalize trailers if they don't explicitly mention BTS content
             if "trailer" in title_lower:
-                has_bts = any(
-                    phrase in title_lower
-                    for phrase in [
-                        "behind the scenes",
-                        "behind the scene",
-                        "bts",
-                        "making of",
-                        "featurette",
-                    ]
-                )
+                has_bts = any(phrase in title_lower for phrase in _TRAILER_BTS_MARKERS)
                 if not has_bts:
                     score -= 40
                     if self.verbose:
@@ -775,26 +848,12 @@ class VideoScorer:
 
         for video in videos:
             is_duplicate = False
-            video_title = video.get("title", "").lower()
             video_duration = video.get("duration", 0)
-
-            # Normalize title for comparison
-            video_words = set(
-                word.strip(".,!?-—|:;()[]")
-                for word in video_title.split()
-                if len(word) > 2 and word not in ["the", "and", "for", "with", "from"]
-            )
+            video_words = _dedup_words(video)
 
             for existing in unique_videos:
-                existing_title = existing.get("title", "").lower()
                 existing_duration = existing.get("duration", 0)
-
-                existing_words = set(
-                    word.strip(".,!?-—|:;()[]")
-                    for word in existing_title.split()
-                    if len(word) > 2
-                    and word not in ["the", "and", "for", "with", "from"]
-                )
+                existing_words = _dedup_words(existing)
 
                 # Calculate title similarity (Jaccard similarity)
                 if video_words and existing_words:
@@ -3,6 +3,7 @@ Sonarr API Client
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from .base_client import BaseArrClient
@@ -10,6 +11,60 @@ from .models import Episode, Season, Series
 
 logger = logging.getLogger(__name__)
 
+# Concurrent episode requests when checking many series at once
+_BATCH_WORKERS = 16
+
+
+def _parse_series(item: dict) -> Series:
+    """Build a Series (with its seasons) from a Sonarr API series resource"""
+    return Series(
+        id=item["id"],
+        title=item["title"],
+        path=item["path"],
+        monitored=item["monitored"],
+        seasons=tuple(
+            Season(
+                season_number=s["seasonNumber"],
+                monitored=s["monitored"],
+                statistics=s.get("statistics", {}),
+            )
+            for s in item.get("seasons", ())
+        ),
+        year=item.get("year"),
+        tvdb_id=item.get("tvdbId"),
+        network=item.get("network"),
+        tags=tuple(item.get("tags") or ()),
+    )
+
+
+def _may_have_season_zero_episodes(series: Series) -> bool:
+    """False when the series listing alone shows season 0 has no episodes
+
+    Only the absence of season 0 or a zero ``totalEpisodeCount`` rules a
+    series out; anything less certain still needs the episode request.
+    """
+    if not series.seasons:
+        return True
+    for season in series.seasons:
+        if season.season_number == 0:
+            return (season.statistics or {}).get("totalEpisodeCount", 1) > 0
+    return False
+
+
+def _parse_episode(item: dict) -> Episode:
+    """Build an Episode from a Sonarr API episode resource"""
+    return Episode(
+        id=item["id"],
+        series_id=item["seriesId"],
+        episode_number=item["episodeNumber"],
+        season_number=item["seasonNumber"],
+        title=item.get("title", "TBA"),
+        has_file=item.get("hasFile", False),
+        monitored=item.get("monitored", False),
+        air_date=item.get("airDate"),
+        overview=item.get("overview"),
+    )
+
 
 class SonarrClient(BaseArrClient[Series]):
     """Client to interact with Sonarr API"""
@@ -28,38 +83,25 @@ class SonarrClient(BaseArrClient[Series]):
 
     def get_all_series(self) -> list[Series]:
         """Fetch all series"""
-        data = self._get("series")
-        series_list = []
-
-        for item in data:
-            seasons = [
-                Season(
-                    season_number=s["seasonNumber"],
-                    monitored=s["monitored"],
-                    statistics=s.get("statistics", {}),
-                )
-                for s in item.get("seasons", [])
-            ]
-
-            series = Series(
-                id=item["id"],
-                title=item["title"],
-                path=item["path"],
-                monitored=item["monitored"],
-                seasons=seasons,
-                year=item.get("year"),
-                tvdb_id=item.get("tvdbId"),
-                network=item.get("network"),
-                tags=item.get("tags", []),
-            )
-            series_list.append(series)
-
-        return series_list
+        return [_parse_series(item) for item in self._get_cached("series")]
 
     def get_monitored_series(self) -> list[Series]:
         """Fetch all monitored series"""
-        all_series = self.get_all_series()
-        return [s for s in all_series if s.monitored]
+        return [
+            _parse_series(item)
+            for item in self._get_cached("series")
+            if item["monitored"]
+        ]
+
+    def get_want_extras_series(self) -> list[Series]:
+        """Fetch monitored series tagged want-extras
+
+        Items are filtered on the raw response, so only matching series are
+        turned into models.
+        """
+        return [
+            _parse_series(item) for item in self._monitored_with_want_extras("series")
+        ]
 
     def get_series_episodes(
         self, series_id: int, season_number: int | None = None
@@ -69,24 +111,9 @@ class SonarrClient(BaseArrClient[Series]):
         if season_number is not None:
             params["seasonNumber"] = season_number
 
-        data = self._get("episode", params=params)
-        episodes = []
-
-        for item in data:
-            episode = Episode(
-                id=item["id"],
-                series_id=item["seriesId"],
-                episode_number=item["episodeNumber"],
-                season_number=item["seasonNumber"],
-                title=item.get("title", "TBA"),
-                has_file=item.get("hasFile", False),
-                monitored=item.get("monitored", False),
-                air_date=item.get("airDate"),
-                overview=item.get("overview"),
-            )
-            episodes.append(episode)
-
-        return episodes
+        return [
+            _parse_episode(item) for item in self._get_cached("episode", params=params)
+        ]
 
     def get_season_zero_episodes(self, series_id: int) -> list[Episode]:
         """Fetch season 0 episodes (specials)"""
@@ -106,18 +133,40 @@ class SonarrClient(BaseArrClient[Series]):
             return any(ep.monitored for ep in episodes)
         except Exception as e:
             logger.warning(
-                f"Error checking season 0 episodes for series {series.id}: {e}"
+                "Error checking season 0 episodes for series %s: %s", series.id, e
             )
             return False
 
+    def batch_monitored_season_zero(self, series_list: list[Series]) -> dict[int, bool]:
+        """
+        Check many series for monitored season 0 episodes concurrently
+
+        Args:
+            series_list: Series to check
+
+        Returns:
+            Mapping of series ID -> has monitored season 0 episodes
+        """
+        # Series whose listing already rules out specials need no request
+        flags = {s.id: False for s in series_list}
+        to_check = [s for s in series_list if _may_have_season_zero_episodes(s)]
+        if not to_check:
+            return flags
+        with ThreadPoolExecutor(
+            max_workers=min(_BATCH_WORKERS, len(to_check))
+        ) as executor:
+            results = executor.map(self.has_monitored_season_zero_episodes, to_check)
+            flags.update(zip((s.id for s in to_check), results, strict=True))
+        return flags
+
     def rescan_series(self, series_id: int) -> Any:
         """Trigger a series scan in Sonarr"""
-        logger.info(f"Triggering scan for series ID {series_id}")
+        logger.info("Triggering scan for series ID %s", series_id)
         try:
             data = {"name": "RescanSeries", "seriesId": series_id}
             result = self._post("command", data)
-            logger.info(f"Scan successfully triggered for series ID {series_id}")
+            logger.info("Scan successfully triggered for series ID %s", series_id)
             return result
         except Exception as e:
-            logger.error(f"Error triggering scan: {e}")
+            logger.error("Error triggering scan: %s", e)
             raise
@@ -3,13 +3,27 @@ Miscellaneous utilities
 """
 
 import logging
+import os
+from pathlib import Path
+
+_LOG_LEVELS = {
+    name: getattr(logging, name)
+    for name in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+}
 
 
 def setup_logging(log_level: str = "INFO"):
-    """Configure logging system"""
-    numeric_level = getattr(logging, log_level.upper(), None)
-    if not isinstance(numeric_level, int):
-        numeric_level = logging.INFO
+    """Configure logging system
+
+    Handlers are only installed once; later calls just change the level
+    (``basicConfig`` would silently ignore it).
+    """
+    numeric_level = _LOG_LEVELS.get(log_level.upper(), logging.INFO)
+
+    root = logging.getLogger()
+    if root.handlers:
+        root.setLevel(numeric_level)
+        return
 
     logging.basicConfig(
         level=numeric_level,
@@ -23,3 +37,15 @@ def format_episode_info(
 ) -> str:
     """Format episode information for display"""
     return f"{series_title} - S{season:02d}E{episode:02d} - {title}"
+
+
+def get_cache_directory(cache_directory: str | Path | None = None) -> Path:
+    """Return the directory used for ExtrarrFin's on-disk caches
+
+    Defaults to ``$XDG_CACHE_HOME/extrarrfin`` (``~/.cache/extrarrfin``).
+    """
+    if cache_directory:
+        return Path(cache_directory).expanduser()
+    xdg_cache = os.getenv("XDG_CACHE_HOME")
+    base = Path(xdg_cache) if xdg_cache else Path.home() / ".cache"
+    return base / "extrarrfin"
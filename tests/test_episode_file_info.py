@@ -0,0 +1,56 @@
+"""
+Unit tests – subtitle language detection in ``Downloader.get_episode_file_info``.
+
+Run:
+    .venv/bin/pytest tests/test_episode_file_info.py -v
+"""
+
+import pytest
+
+from extrarrfin.downloader import Downloader
+from extrarrfin.models import Episode, Season, Series
+
+
+@pytest.fixture
+def downloader(tmp_path):
+    d = Downloader(cache_directory=tmp_path / "cache")
+    yield d
+    d.close()
+
+
+def _episode_info(downloader: Downloader, directory, *names: str) -> dict:
+    series = Series(
+        id=1,
+        title="Show",
+        path=str(directory),
+        monitored=True,
+        seasons=(Season(season_number=0, monitored=True, statistics={}),),
+    )
+    episode = Episode(
+        id=10,
+        series_id=1,
+        episode_number=1,
+        season_number=0,
+        title="Pilot",
+        has_file=False,
+        monitored=True,
+    )
+    for name in names:
+        (directory / name).write_text("")
+    return downloader.get_episode_file_info(series, episode, directory)
+
+
+@pytest.mark.parametrize(
+    "filename, lang",
+    [
+        pytest.param("Show - S00E01 - Pilot.fr.srt", "fr", id="plain"),
+        pytest.param("Show - S00E01 - Pilot.fr.forced.srt", "fr", id="forced"),
+        pytest.param("Show - S00E01 - Pilot.en.sdh.srt", "en", id="sdh"),
+        pytest.param("Show - S00E01 - Pilot.srt", "unknown", id="untagged"),
+        pytest.param("Show - S00E01 - Other title.de.srt", "de", id="fallback"),
+    ],
+)
+def test_subtitle_language(downloader, tmp_path, filename, lang):
+    info = _episode_info(downloader, tmp_path, filename)
+    assert info["subtitles"] == {lang: [filename]}
+    assert info["subtitle_count"] == 1
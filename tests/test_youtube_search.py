@@ -242,3 +242,34 @@ def test_theme_youtube_movie(title, year, expected_urls, tmp_path):
         pytest.skip(
             f"No expected_urls configured for movie '{title}'. Found: {result_url}"
         )
+
+
+# ---------------------------------------------------------------------------
+# Flat search payload
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.integration
+def test_flat_search_entries_have_scoring_fields():
+    """
+    The extras/behind-the-scenes searches use extract_flat="in_playlist".
+    Each entry must already carry the fields the scorers read, otherwise
+    yt-dlp would have to run a full extraction per video.
+    """
+    import yt_dlp
+
+    downloader = _make_downloader()
+    ydl_opts = {
+        **downloader._base_ydl_opts,
+        "extract_flat": "in_playlist",
+    }
+
+    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        result = ydl.extract_info(
+            "ytsearch3:Stranger Things behind the scenes", download=False
+        )
+
+    assert result and result.get("entries"), "Search returned no entries"
+    entry = result["entries"][0]
+    for field in ("id", "title", "channel", "duration", "view_count"):
+        assert field in entry, f"Flat search entry is missing '{field}'"